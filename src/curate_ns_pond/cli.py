@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 import json
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 import typer
 
-from .fulltext import FullTextFetcher
-from .merge import merge_jsonl_files
-from .resolution import IdentifierResolver, normalize_identifier
-from .services.pubmed import PubMedSearchService
+# Command implementations (httpx clients, bs4, ACE, ...) are imported inside
+# each command so ``--help`` and unrelated commands start quickly.
+from .jsonl import write_jsonl
 from .settings import PipelineSettings
 from .storage import build_hashed_output_dir, hash_identifiers
 
@@ -38,6 +37,20 @@ def _parse_date(option_name: str, value: Optional[str]) -> Optional[date]:
         raise typer.BadParameter(f"Invalid date for {option_name}: {value}") from exc
 
 
+def _format_timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _load_settings() -> PipelineSettings:
+    settings = PipelineSettings()
+    settings.ensure_directories()
+    if settings.http_cache:
+        from .services.transport import enable_http_cache
+
+        enable_http_cache(settings.http_cache_dir)
+    return settings
+
+
 @search_app.command("pubmed")
 def search_pubmed(
     query: str = typer.Argument(..., help="PubMed search query."),
@@ -53,11 +66,12 @@ def search_pubmed(
 ) -> None:
     """Run a PubMed search and persist PMIDs to the raw data directory."""
 
+    from .services.pubmed import PubMedSearchService
+
     parsed_start = _parse_date("start-date", start_date)
     parsed_end = _parse_date("end-date", end_date)
 
-    settings = PipelineSettings()
-    settings.ensure_directories()
+    settings = _load_settings()
 
     identifiers = [query]
     if start_date:
@@ -66,7 +80,8 @@ def search_pubmed(
         identifiers.append(f"end:{end_date}")
 
     search_hash = hash_identifiers(identifiers)
-    run_date = datetime.utcnow().strftime("%Y%m%d")
+    started_at = datetime.now(timezone.utc)
+    run_date = started_at.strftime("%Y%m%d")
     run_dir = settings.raw_dir / "pubmed" / search_hash / run_date
     run_dir.mkdir(parents=True, exist_ok=True)
 
@@ -82,7 +97,7 @@ def search_pubmed(
         "start_date": parsed_start.isoformat() if parsed_start else None,
         "end_date": parsed_end.isoformat() if parsed_end else None,
         "result_count": len(pmids),
-        "run_started_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "run_started_at": _format_timestamp(started_at),
         "retmax": retmax,
     }
 
@@ -100,6 +115,8 @@ def resolve_ids(
 ) -> None:
     """Resolve PMIDs/PMCIDs/DOIs into unified records."""
 
+    from .resolution import IdentifierResolver, normalize_identifier
+
     raw_lines = [line.strip() for line in input_file.read_text().splitlines()]
     identifiers = [line for line in raw_lines if line]
     if not identifiers:
@@ -110,8 +127,7 @@ def resolve_ids(
     except ValueError as exc:
         raise typer.BadParameter(str(exc), param_name="input_file") from exc
 
-    settings = PipelineSettings()
-    settings.ensure_directories()
+    settings = _load_settings()
 
     hashed_components = [item.hash_component for item in normalized]
     base_dir = settings.interim_dir / "resolved"
@@ -121,10 +137,7 @@ def resolve_ids(
         result = resolver.resolve(normalized)
 
     records_path = run_dir / "records.jsonl"
-    with records_path.open("w", encoding="utf-8") as handle:
-        for record in result.records:
-            handle.write(json.dumps(record.to_dict(), separators=(",", ":")))
-            handle.write("\n")
+    write_jsonl(records_path, result.records)
 
     metadata = {
         "input_file": str(input_file),
@@ -134,7 +147,7 @@ def resolve_ids(
         "sources": sorted(result.sources_used),
         "errors": result.errors,
         "input_hash": run_dir.name,
-        "run_started_at": result.started_at.isoformat(timespec="seconds") + "Z",
+        "run_started_at": _format_timestamp(result.started_at),
         "records_path": str(records_path),
     }
 
@@ -159,22 +172,22 @@ def merge_records(
 ) -> None:
     """Merge identifier records from one or more JSONL files."""
 
+    from .merge import merge_jsonl_files
+
     if not input_files:
         raise typer.BadParameter("Provide at least one JSONL file", param_name="input_files")
 
     settings = PipelineSettings()
     settings.ensure_directories()
 
+    started_at = datetime.now(timezone.utc)
     outcome = merge_jsonl_files(input_files)
 
     run_dir = settings.processed_dir / "merged" / outcome.input_hash
     run_dir.mkdir(parents=True, exist_ok=True)
 
     records_path = run_dir / "records.jsonl"
-    with records_path.open("w", encoding="utf-8") as handle:
-        for record in outcome.records:
-            handle.write(json.dumps(record, separators=(",", ":")))
-            handle.write("\n")
+    write_jsonl(records_path, outcome.records)
 
     metadata = {
         "input_files": outcome.source_files,
@@ -182,7 +195,7 @@ def merge_records(
         "record_count": len(outcome.records),
         "error_count": len(outcome.errors),
         "errors": outcome.errors,
-        "run_started_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "run_started_at": _format_timestamp(started_at),
         "records_path": str(records_path),
     }
 
@@ -204,17 +217,21 @@ def fetch_fulltext(
     records: list[Path] = typer.Argument(
         ..., exists=True, readable=True, help="Resolved/merged JSONL files to fetch full text for."
     ),
+    concurrency: int = typer.Option(
+        10, min=1, help="Maximum number of concurrent requests per full text source."
+    ),
 ) -> None:
     """Download full text documents for the provided records."""
 
+    from .fulltext import FullTextFetcher
+
     if not records:
         raise typer.BadParameter("Provide at least one JSONL file", param_name="records")
 
-    settings = PipelineSettings()
-    settings.ensure_directories()
+    settings = _load_settings()
 
-    fetcher = FullTextFetcher(settings=settings)
-    result = fetcher.fetch_from_files(records)
+    with FullTextFetcher(settings=settings, concurrency=concurrency) as fetcher:
+        result = fetcher.fetch_from_files(records)
 
     run_dir = settings.processed_dir / "fulltext" / result.batch_hash
     typer.echo(
@@ -2,22 +2,41 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import csv
+import dbm
+import multiprocessing
 import re
+import shelve
 import subprocess
 import tempfile
+import threading
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Callable, Sequence
 
 from bs4 import BeautifulSoup
 
+try:  # pragma: no cover - optional speedup from the fulltext extra
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional speedup from the fulltext extra
+    LexborHTMLParser = None
+
+try:  # pragma: no cover - optional speedup
+    import xxhash
+except ImportError:  # pragma: no cover - optional speedup
+    xxhash = None
+
+from .jsonl import dump_json, iter_jsonl, write_jsonl
+from .ratelimit import NCBI_HOST, TokenBucket, ncbi_rate, shared_bucket
 from .services.entrez import EntrezSummaryClient
 from .services.semantic_scholar import SemanticScholarClient
 from .settings import PipelineSettings
-from .storage import hash_file_contents
+from .storage import combine_file_digests, new_content_hasher, sorted_paths
 
 __all__ = [
     "ACEClient",
@@ -28,16 +47,77 @@ __all__ = [
     "PubGetClient",
 ]
 
+# Any run of whitespace containing a line break (the separators ``str.splitlines`` uses).
+_LINE_BREAK_RE = re.compile(r"\s*[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]\s*")
+_YEAR_RE = re.compile(r"(19|20)\d{2}")
+_ACE_JOURNAL_CACHE_TTL = 30 * 86400
+# Below this many documents, process start-up and pickling outweigh parallel parsing.
+_PROCESS_POOL_THRESHOLD = 16
+# The pool is created from a worker thread while the PubGet and ACE thread pools are
+# running; forking a multithreaded process can copy held locks into the children.
+_PROCESS_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
 
 class PubGetClient:
-    """Thin wrapper around the ``pubget`` command-line interface."""
+    """Fetch PMC full text with ``pubget``, in-process by default."""
 
-    def __init__(self, *, executable: str = "pubget") -> None:
+    def __init__(
+        self,
+        *,
+        executable: str = "pubget",
+        use_subprocess: bool = False,
+        api_key: str | None = None,
+        rate_limiter: TokenBucket | None = None,
+    ) -> None:
         self.executable = executable
+        self.use_subprocess = use_subprocess
+        self.api_key = api_key
+        # pubget downloads through E-utilities, so it shares the NCBI request budget.
+        self.rate_limiter = rate_limiter or shared_bucket(NCBI_HOST, ncbi_rate(api_key))
+        self._pubget: Any | None = None
+
+    @staticmethod
+    def _load_pubget_module() -> Any:
+        try:
+            import pubget
+        except ImportError as exc:  # pragma: no cover - depends on extra being installed
+            raise RuntimeError(
+                "pubget package not available; install the 'fulltext' extra"
+            ) from exc
+        return pubget
 
     def fetch_text(self, pmcid: str) -> str | None:
         """Fetch plain-text full text for the provided PMCID."""
 
+        self.rate_limiter.acquire()
+        if self.use_subprocess:
+            return self._fetch_text_subprocess(pmcid)
+        return self._fetch_text_library(pmcid)
+
+    def _fetch_text_library(self, pmcid: str) -> str | None:
+        digits = pmcid.upper().removeprefix("PMC")
+        if not digits.isdigit():
+            return None
+        if self._pubget is None:
+            self._pubget = self._load_pubget_module()
+        pubget = self._pubget
+        with tempfile.TemporaryDirectory(prefix="pubget-") as data_dir:
+            download_dir, _ = pubget.download_pmcids([int(digits)], data_dir, api_key=self.api_key)
+            articles_dir, _ = pubget.extract_articles(download_dir)
+            data_dir_path, _ = pubget.extract_data_to_csv(articles_dir)
+            text_path = Path(data_dir_path) / "text.csv"
+            if not text_path.is_file():
+                return None
+            with text_path.open(newline="", encoding="utf-8") as handle:
+                for row in csv.DictReader(handle):
+                    body = (row.get("body") or "").strip()
+                    if body:
+                        return body
+        return None
+
+    def _fetch_text_subprocess(self, pmcid: str) -> str | None:
         with tempfile.NamedTemporaryFile(suffix=".txt") as tmp:
             command = [
                 self.executable,
@@ -76,6 +156,8 @@ class ACEClient:
         temp_dir: str | Path | None = None,
         mode: str = "requests",
         prefer_pmc_source: bool | str = True,
+        metadata_cache_dir: str | Path | None = None,
+        rate_limiter: TokenBucket | None = None,
     ) -> None:
         if executable and executable != "ace":  # pragma: no cover - compatibility shim
             warnings.warn(
@@ -86,7 +168,9 @@ class ACEClient:
 
         ace_scrape = self._load_ace_module()
 
-        self._metadata_fetcher = metadata_fetcher or getattr(ace_scrape, "get_pubmed_metadata", None)
+        self._metadata_fetcher = metadata_fetcher or getattr(
+            ace_scrape, "get_pubmed_metadata", None
+        )
         if self._metadata_fetcher is None:
             raise RuntimeError("Invalid ACE installation: missing get_pubmed_metadata helper")
 
@@ -99,6 +183,13 @@ class ACEClient:
 
         self._mode = mode
         self._prefer_pmc_source = prefer_pmc_source
+        # ACE's PubMed metadata lookups go to E-utilities without an API key.
+        self._rate_limiter = rate_limiter or shared_bucket(NCBI_HOST, ncbi_rate(None))
+        # Journal lookups survive across runs so retried PMIDs skip the PubMed round trip.
+        # The shelf is opened on first use and stays open until ``close``.
+        self._journal_cache_dir = Path(metadata_cache_dir) if metadata_cache_dir else None
+        self._journal_cache: shelve.Shelf[tuple[float, str]] | None = None
+        self._journal_cache_lock = threading.Lock()
 
     @staticmethod
     def _load_ace_module() -> Any:
@@ -108,6 +199,21 @@ class ACEClient:
             raise RuntimeError("ACE package not available; install the 'fulltext' extra") from exc
         return ace_scrape
 
+    def close(self) -> None:
+        with self._journal_cache_lock:
+            if self._journal_cache is not None:
+                self._journal_cache.close()
+                self._journal_cache = None
+        if self._temp_manager is not None:
+            self._temp_manager.cleanup()
+            self._temp_manager = None
+
+    def __enter__(self) -> "ACEClient":  # pragma: no cover - trivial
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - trivial
+        self.close()
+
     def _ensure_store_path(self, temp_dir: str | Path | None) -> str:
         if temp_dir is not None:
             return str(Path(temp_dir))
@@ -115,17 +221,16 @@ class ACEClient:
         return self._temp_manager.name
 
     def fetch_text(self, pmid: str) -> str | None:
-        journal = "unknown"
-        metadata: dict[str, Any] | None = None
-        try:
-            metadata = self._metadata_fetcher(pmid)
-        except Exception:  # pragma: no cover - defensive network call guard
-            metadata = None
+        html = self.fetch_html(pmid)
+        if not html:
+            return None
+        text = _clean_html(html)
+        return text or None
 
-        if isinstance(metadata, dict):
-            journal_value = metadata.get("journal") or metadata.get("source")
-            if isinstance(journal_value, str) and journal_value.strip():
-                journal = journal_value
+    def fetch_html(self, pmid: str) -> str | None:
+        """Return the raw article HTML for ``pmid`` without extracting its text."""
+
+        journal = self._lookup_journal(pmid)
 
         try:
             html = self._scraper.get_html_by_pmid(
@@ -137,19 +242,63 @@ class ACEClient:
         except Exception as exc:  # pragma: no cover - relies on external service
             raise RuntimeError(f"ACE scrape failed for PMID {pmid}") from exc
 
-        if not html:
-            return None
+        return html or None
 
-        text = self._clean_html(html)
-        return text or None
+    def _lookup_journal(self, pmid: str) -> str:
+        journal = self._cached_journal(pmid)
+        if journal is not None:
+            return journal
 
-    @staticmethod
-    def _clean_html(html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
-        raw_text = soup.get_text(separator="\n")
-        lines = [line.strip() for line in raw_text.splitlines()]
-        filtered = "\n".join(line for line in lines if line)
-        return filtered.strip()
+        metadata: dict[str, Any] | None = None
+        self._rate_limiter.acquire()
+        try:
+            metadata = self._metadata_fetcher(pmid)
+        except Exception:  # pragma: no cover - defensive network call guard
+            metadata = None
+
+        if isinstance(metadata, dict):
+            journal_value = metadata.get("journal") or metadata.get("source")
+            if isinstance(journal_value, str) and journal_value.strip():
+                self._store_journal(pmid, journal_value)
+                return journal_value
+        return "unknown"
+
+    def _open_journal_cache(self, *, create: bool) -> shelve.Shelf[tuple[float, str]] | None:
+        """Return the open journal shelf; the caller must hold ``_journal_cache_lock``."""
+
+        if self._journal_cache is None and self._journal_cache_dir is not None:
+            if not create and not self._journal_cache_dir.is_dir():
+                return None
+            self._journal_cache_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                self._journal_cache = shelve.open(str(self._journal_cache_dir / "journals"))
+            except dbm.error as exc:
+                # gdbm allows one writer, so a concurrent run holding the shelf locks us
+                # out; carry on uncached rather than failing every ACE lookup.
+                warnings.warn(
+                    f"ACE journal cache unavailable ({exc}); continuing without it",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+                self._journal_cache_dir = None
+        return self._journal_cache
+
+    def _cached_journal(self, pmid: str) -> str | None:
+        with self._journal_cache_lock:
+            cache = self._open_journal_cache(create=False)
+            entry = cache.get(pmid) if cache is not None else None
+        if entry is None:
+            return None
+        stored_at, journal = entry
+        if time.time() - stored_at > _ACE_JOURNAL_CACHE_TTL:
+            return None
+        return journal
+
+    def _store_journal(self, pmid: str, journal: str) -> None:
+        with self._journal_cache_lock:
+            cache = self._open_journal_cache(create=True)
+            if cache is not None:
+                cache[pmid] = (time.time(), journal)
 
 
 @dataclass(slots=True)
@@ -214,6 +363,10 @@ class FullTextResult:
         return sum(1 for record in self.records if not record.text)
 
 
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class FullTextFetcher:
     """Coordinate full text retrieval via PubGet and ACE."""
 
@@ -225,36 +378,103 @@ class FullTextFetcher:
         ace_client: ACEClient | None = None,
         semantic_client: SemanticScholarClient | None = None,
         entrez_client: EntrezSummaryClient | None = None,
+        concurrency: int = 10,
+        now: Callable[[], datetime] | None = None,
     ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
         self.settings = settings or PipelineSettings()
+        self._now = now or _utc_now
         self._pubget = pubget_client or PubGetClient()
-        self._ace = ace_client or ACEClient()
+        self._ace = ace_client or ACEClient(
+            metadata_cache_dir=self.settings.interim_dir / "ace_metadata"
+        )
         self._semantic = semantic_client or SemanticScholarClient()
         self._entrez = entrez_client or EntrezSummaryClient()
+        self._owns_ace = ace_client is None
+        self._owns_semantic = semantic_client is None
+        self._owns_entrez = entrez_client is None
+        self.concurrency = concurrency
+
+    def close(self) -> None:
+        if self._owns_ace:
+            self._ace.close()
+        if self._owns_semantic:
+            self._semantic.close()
+        if self._owns_entrez:
+            self._entrez.close()
+
+    def __enter__(self) -> "FullTextFetcher":  # pragma: no cover - trivial
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - trivial
+        self.close()
 
     def fetch_from_files(self, jsonl_paths: Sequence[Path]) -> FullTextResult:
+        """Synchronous wrapper around :meth:`afetch_from_files`."""
+
+        return asyncio.run(self.afetch_from_files(jsonl_paths))
+
+    async def afetch_from_files(self, jsonl_paths: Sequence[Path]) -> FullTextResult:
+        """Fetch full text for every record, running up to ``concurrency`` lookups per source."""
+
         if not jsonl_paths:
             raise ValueError("At least one JSONL file must be provided")
 
-        started_at = datetime.utcnow()
+        started_at = self._now()
         errors: list[str] = []
-        records = self._load_records(jsonl_paths, errors)
+        file_digests: list[str] = []
+        records = self._load_records(jsonl_paths, errors, file_digests)
 
         self.settings.ensure_directories()
-        batch_hash = hash_file_contents(jsonl_paths)
+        batch_hash = combine_file_digests(file_digests)
         run_dir = self.settings.processed_dir / "fulltext" / batch_hash
-        records_dir = run_dir / "records"
-        records_dir.mkdir(parents=True, exist_ok=True)
+        run_dir.mkdir(parents=True, exist_ok=True)
+
+        # PubGet and ACE hit different services, so each gets its own bounded worker pool.
+        with (
+            ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="pubget"
+            ) as pubget_pool,
+            ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="ace") as ace_pool,
+        ):
+            outcomes = await asyncio.gather(
+                *(self._process_record(record, pubget_pool, ace_pool) for record in records)
+            )
+
+        ace_indices = [index for index, ((_, source), _) in enumerate(outcomes) if source == "ace"]
+        if ace_indices:
+            texts = await asyncio.to_thread(
+                _clean_html_batch, [outcomes[index][0][0] for index in ace_indices]
+            )
+            for index, text in zip(ace_indices, texts):
+                record_errors = outcomes[index][1]
+                if not text:
+                    record_errors.append(
+                        f"ACE returned no text for PMID {records[index].get('pmid')}"
+                    )
+                outcomes[index] = ((text or None, "ace" if text else None), record_errors)
 
-        fulltext_records: list[FullTextRecord] = []
         sources_used: set[str] = set()
         metadata_sources: set[str] = set()
 
-        for record in records:
-            text, source = self._fetch_text(record, errors)
+        # ``gather`` preserves input order, so errors stay grouped per record.
+        for (_, source), record_errors in outcomes:
+            errors.extend(record_errors)
+            if source:
+                sources_used.add(source)
+
+        # Metadata is only needed for records with text; look it up in batches.
+        with_text = [record for record, ((text, _), _) in zip(records, outcomes) if text]
+        semantic_lookup, entrez_lookup = await asyncio.to_thread(self._prefetch_metadata, with_text)
+
+        fulltext_records: list[FullTextRecord] = []
+        for record, ((text, source), _) in zip(records, outcomes):
             metadata: BibliographicMetadata | None = None
             if text:
-                metadata = self._fetch_metadata(record, metadata_sources)
+                metadata = self._fetch_metadata(
+                    record, semantic_lookup, entrez_lookup, metadata_sources
+                )
             fulltext_records.append(
                 FullTextRecord(
                     pmid=record.get("pmid"),
@@ -265,13 +485,9 @@ class FullTextFetcher:
                     metadata=metadata,
                 )
             )
-            if source:
-                sources_used.add(source)
 
-        for index, record in enumerate(fulltext_records):
-            slug = self._record_slug(record, index)
-            path = records_dir / f"{slug}.json"
-            path.write_text(json.dumps(record.to_dict(), indent=2, sort_keys=True), encoding="utf-8")
+        records_path = run_dir / "records.jsonl"
+        write_jsonl(records_path, fulltext_records)
 
         metadata_path = run_dir / "metadata.json"
         metadata_summary = {
@@ -283,10 +499,10 @@ class FullTextFetcher:
             "text_sources": sorted(sources_used),
             "metadata_sources": sorted(metadata_sources),
             "errors": errors,
-            "run_started_at": started_at.isoformat(timespec="seconds") + "Z",
-            "records_dir": str(records_dir),
+            "run_started_at": started_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "records_path": str(records_path),
         }
-        metadata_path.write_text(json.dumps(metadata_summary, indent=2, sort_keys=True), encoding="utf-8")
+        metadata_path.write_bytes(dump_json(metadata_summary))
 
         return FullTextResult(
             records=fulltext_records,
@@ -298,118 +514,193 @@ class FullTextFetcher:
             started_at=started_at,
         )
 
-    def _load_records(self, paths: Sequence[Path], errors: list[str]) -> list[dict[str, str | None]]:
-        unique: dict[tuple[str | None, str | None, str | None], dict[str, str | None]] = {}
-        for path in sorted(paths, key=lambda item: item.as_posix()):
-            with path.open("r", encoding="utf-8") as handle:
-                for idx, raw_line in enumerate(handle, start=1):
-                    line = raw_line.strip()
-                    if not line:
-                        continue
-                    try:
-                        payload = json.loads(line)
-                    except json.JSONDecodeError as exc:
-                        errors.append(f"{path}:{idx}: invalid JSON ({exc.msg})")
-                        continue
-                    if not isinstance(payload, dict):
-                        errors.append(f"{path}:{idx}: expected JSON object per line")
-                        continue
-                    pmid = payload.get("pmid")
-                    pmcid = payload.get("pmcid")
-                    doi = payload.get("doi")
-                    if not any([pmid, pmcid, doi]):
-                        errors.append(f"{path}:{idx}: record missing identifiers")
-                        continue
-                    key = (pmid, pmcid, doi)
-                    unique.setdefault(key, {"pmid": pmid, "pmcid": pmcid, "doi": doi})
-        return list(unique.values())
-
-    def _fetch_text(self, record: dict[str, str | None], errors: list[str]) -> tuple[str | None, str | None]:
+    async def _process_record(
+        self,
+        record: dict[str, str | None],
+        pubget_pool: ThreadPoolExecutor,
+        ace_pool: ThreadPoolExecutor,
+    ) -> tuple[tuple[str | None, str | None], list[str]]:
+        # The clients are blocking (subprocess, ACE), so they run in worker threads.
+        loop = asyncio.get_running_loop()
+        errors: list[str] = []
         pmcid = record.get("pmcid")
         pmid = record.get("pmid")
 
         if pmcid:
-            try:
-                text = self._pubget.fetch_text(pmcid)
-            except Exception as exc:  # pragma: no cover - defensive
-                errors.append(f"PubGet failed for {pmcid}: {exc}")
-            else:
-                if text:
-                    return text, "pubget"
-                errors.append(f"PubGet returned no text for {pmcid}")
+            text = await loop.run_in_executor(pubget_pool, self._fetch_pubget_text, pmcid, errors)
+            if text:
+                return (text, "pubget"), errors
 
         if pmid:
-            try:
-                text = self._ace.fetch_text(pmid)
-            except Exception as exc:  # pragma: no cover - defensive
-                errors.append(f"ACE failed for PMID {pmid}: {exc}")
-                return None, None
-            if text:
-                return text, "ace"
-            errors.append(f"ACE returned no text for PMID {pmid}")
+            # ACE yields raw HTML; its text is extracted for the whole batch afterwards.
+            html = await loop.run_in_executor(ace_pool, self._fetch_ace_html, pmid, errors)
+            if html:
+                return (html, "ace"), errors
+
+        return (None, None), errors
+
+    def _load_records(
+        self, paths: Sequence[Path], errors: list[str], file_digests: list[str] | None = None
+    ) -> list[dict[str, str | None]]:
+        """Load unique records, appending each file's content digest to ``file_digests``."""
+
+        seen: set[object] = set()
+        records: list[dict[str, str | None]] = []
+        for path in sorted_paths(paths):
+            hasher = new_content_hasher() if file_digests is not None else None
+            for idx, payload in iter_jsonl(path, errors, hasher):
+                key = (payload.get("pmid"), payload.get("pmcid"), payload.get("doi"))
+                if not any(key):
+                    errors.append(f"{path}:{idx}: record missing identifiers")
+                    continue
+                seen_key = _dedup_key(key)
+                if seen_key in seen:
+                    continue
+                seen.add(seen_key)
+                records.append({"pmid": key[0], "pmcid": key[1], "doi": key[2]})
+            if hasher is not None:
+                file_digests.append(hasher.hexdigest())
+        return records
+
+    def _fetch_pubget_text(self, pmcid: str, errors: list[str]) -> str | None:
+        try:
+            text = self._pubget.fetch_text(pmcid)
+        except Exception as exc:  # pragma: no cover - defensive
+            errors.append(f"PubGet failed for {pmcid}: {exc}")
+            return None
+        if not text:
+            errors.append(f"PubGet returned no text for {pmcid}")
+        return text or None
 
-        return None, None
+    def _fetch_ace_html(self, pmid: str, errors: list[str]) -> str | None:
+        try:
+            html = self._ace.fetch_html(pmid)
+        except Exception as exc:  # pragma: no cover - defensive
+            errors.append(f"ACE failed for PMID {pmid}: {exc}")
+            return None
+        if not html:
+            errors.append(f"ACE returned no text for PMID {pmid}")
+        return html or None
 
-    def _fetch_metadata(self, record: dict[str, str | None], metadata_sources: set[str]) -> BibliographicMetadata | None:
-        identifiers = [identifier for identifier in (record.get("pmid"), record.get("doi")) if identifier]
-        for identifier in identifiers:
+    def _prefetch_metadata(
+        self, records: Sequence[dict[str, str | None]]
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        semantic_ids: list[str] = []
+        for record in records:
+            semantic_ids.extend(self._semantic_ids(record))
+        semantic_lookup: dict[str, dict[str, Any]] = {}
+        if semantic_ids:
+            try:
+                semantic_lookup = self._semantic.fetch_metadata_batch(semantic_ids)
+            except Exception:  # pragma: no cover - defensive
+                semantic_lookup = {}
+
+        # Entrez is only consulted for PMIDs that Semantic Scholar could not describe.
+        pmids = [
+            record["pmid"]
+            for record in records
+            if record.get("pmid")
+            and not any(key in semantic_lookup for key in self._semantic_ids(record))
+        ]
+        entrez_lookup: dict[str, dict[str, Any]] = {}
+        if pmids:
             try:
-                metadata = self._semantic.fetch_metadata(identifier)
-            except Exception as exc:  # pragma: no cover - defensive
-                continue
+                entrez_lookup = self._entrez.fetch_metadata_batch(pmids)
+            except Exception:  # pragma: no cover - defensive
+                entrez_lookup = {}
+        return semantic_lookup, entrez_lookup
+
+    @staticmethod
+    def _semantic_ids(record: dict[str, str | None]) -> list[str]:
+        identifiers: list[str] = []
+        if record.get("pmid"):
+            identifiers.append(f"PMID:{record['pmid']}")
+        if record.get("doi"):
+            identifiers.append(f"DOI:{record['doi']}")
+        return identifiers
+
+    def _fetch_metadata(
+        self,
+        record: dict[str, str | None],
+        semantic_lookup: dict[str, dict[str, Any]],
+        entrez_lookup: dict[str, dict[str, Any]],
+        metadata_sources: set[str],
+    ) -> BibliographicMetadata | None:
+        for identifier in self._semantic_ids(record):
+            metadata = semantic_lookup.get(identifier)
             if metadata:
                 metadata_sources.add("semantic-scholar")
-                return self._metadata_from_dict(metadata, "semantic-scholar")
+                return self._metadata_from_semantic(metadata)
 
         pmid = record.get("pmid")
-        if not pmid:
-            return None
-        try:
-            metadata = self._entrez.fetch_metadata(pmid)
-        except Exception:  # pragma: no cover - defensive
-            return None
+        metadata = entrez_lookup.get(pmid) if pmid else None
         if metadata:
             metadata_sources.add("entrez")
-            return self._metadata_from_dict(metadata, "entrez")
+            return self._metadata_from_entrez(metadata)
         return None
 
     @staticmethod
-    def _metadata_from_dict(data: dict[str, Any], source: str) -> BibliographicMetadata:
-        authors = data.get("authors") or []
-        if isinstance(authors, dict):  # pragma: no cover - defensive
-            authors = list(authors.values())
-        if not isinstance(authors, list):
-            authors = []
-        authors_list: list[str] = []
-        for author in authors:
-            if isinstance(author, str):
-                authors_list.append(author)
-            elif isinstance(author, dict) and author.get("name"):
-                authors_list.append(str(author["name"]))
-            else:
-                authors_list.append(str(author))
+    def _metadata_from_semantic(data: dict[str, Any]) -> BibliographicMetadata:
+        # Shaped by SemanticScholarClient: author names are already strings,
+        # ``year`` is an int and ``journal`` is an object with a ``name``.
+        journal = data.get("journal") or {}
         year = data.get("year")
-        if isinstance(year, str):
-            match = re.search(r"(19|20)\d{2}", year)
-            year_value = int(match.group()) if match else None
-        elif isinstance(year, int):
-            year_value = year
-        else:
-            year_value = None
+        return BibliographicMetadata(
+            title=data.get("title"),
+            abstract=data.get("abstract"),
+            authors=data.get("authors") or [],
+            journal=journal.get("name") or data.get("venue") or None,
+            year=year if isinstance(year, int) else None,
+            source="semantic-scholar",
+        )
+
+    @staticmethod
+    def _metadata_from_entrez(data: dict[str, Any]) -> BibliographicMetadata:
+        # Shaped by EntrezSummaryClient: ``year`` is a free-form publication date.
+        match = _YEAR_RE.search(data.get("year") or "")
         return BibliographicMetadata(
             title=_safe_str(data.get("title")),
             abstract=_safe_str(data.get("abstract")),
-            authors=authors_list,
-            journal=_safe_str(data.get("journal")) or _safe_str(data.get("venue")),
-            year=year_value,
-            source=source,
+            authors=data.get("authors") or [],
+            journal=_safe_str(data.get("journal")),
+            year=int(match.group()) if match else None,
+            source="entrez",
         )
 
-    @staticmethod
-    def _record_slug(record: FullTextRecord, index: int) -> str:
-        identifier = (record.pmid or record.pmcid or record.doi or f"record-{index}").lower()
-        slug = re.sub(r"[^a-z0-9_-]+", "_", identifier).strip("_")
-        return f"{index:04d}_{slug or 'record'}"
+
+def _dedup_key(key: tuple[Any, Any, Any]) -> object:
+    # A 128-bit digest is a single int per record instead of a tuple of three strings.
+    if xxhash is None:
+        return key
+    return xxhash.xxh3_128_intdigest("\x1f".join(map(repr, key)).encode("utf-8"))
+
+
+def _clean_html(html: str) -> str:
+    """Return the visible text of ``html`` with blank lines collapsed."""
+
+    return _LINE_BREAK_RE.sub("\n", _html_to_text(html)).strip()
+
+
+def _clean_html_batch(htmls: Sequence[str]) -> list[str]:
+    # Parsing is CPU bound and holds the GIL, so large batches go to worker processes.
+    if len(htmls) < _PROCESS_POOL_THRESHOLD:
+        return [_clean_html(html) for html in htmls]
+    with ProcessPoolExecutor(mp_context=_PROCESS_POOL_CONTEXT) as pool:
+        return list(pool.map(_clean_html, htmls, chunksize=8))
+
+
+def _html_to_text(html: str) -> str:
+    """Return the visible text of ``html`` with one text node per line."""
+
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        for node in tree.css("script,style"):
+            node.decompose()
+        return tree.root.text(separator="\n") if tree.root is not None else ""
+    soup = BeautifulSoup(html, "html.parser")
+    for node in soup(["script", "style"]):
+        node.decompose()
+    return soup.get_text(separator="\n")
 
 
 def _safe_str(value: Any) -> str | None:
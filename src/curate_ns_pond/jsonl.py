@@ -0,0 +1,110 @@
+"""Streaming helpers for JSON Lines files."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from hashlib import _Hash
+
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+__all__ = ["dump_json", "iter_jsonl", "loads", "write_jsonl"]
+
+_READ_BUFFER_SIZE = 1 << 20
+_WRITE_FLUSH_SIZE = 4 << 20
+
+# Both parsers accept UTF-8 bytes, so lines and response bodies never need
+# decoding in Python; both raise ValueError subclasses on malformed input.
+loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+# Dataclass records are written without building an intermediate dict per
+# record: orjson serializes them natively, and the stdlib path falls back to
+# dataclasses.asdict.
+if orjson is not None:
+
+    def _dump_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    def dump_json(obj: Any) -> bytes:
+        """Serialize ``obj`` as indented JSON with sorted keys."""
+
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+else:
+
+    def _default(obj: Any) -> Any:
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return dataclasses.asdict(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _dump_line(obj: Any) -> bytes:
+        return (json.dumps(obj, separators=(",", ":"), default=_default) + "\n").encode("utf-8")
+
+    def dump_json(obj: Any) -> bytes:
+        """Serialize ``obj`` as indented JSON with sorted keys."""
+
+        return json.dumps(obj, indent=2, sort_keys=True, default=_default).encode("utf-8")
+
+
+def iter_jsonl(
+    path: Path, errors: list[str], hasher: _Hash | None = None
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield ``(line_number, object)`` pairs from ``path``, recording bad lines in ``errors``.
+
+    When ``hasher`` is given it is updated with the raw file contents as they are
+    read, so callers can hash their inputs without a second pass over the files.
+    """
+
+    idx = 0
+    carry = b""
+    with open(path, "rb") as handle:
+        while True:
+            chunk = handle.read(_READ_BUFFER_SIZE)
+            if hasher is not None and chunk:
+                hasher.update(chunk)
+            if chunk:
+                # ``splitlines`` accepts \n, \r\n and bare \r like text mode did; a trailing
+                # \r is carried over in case its \n starts the next chunk.
+                lines = (carry + chunk).splitlines(keepends=True)
+                carry = lines.pop() if lines and not lines[-1].endswith(b"\n") else b""
+            else:
+                lines = [carry] if carry else []
+            for raw_line in lines:
+                idx += 1
+                if not raw_line or raw_line.isspace():
+                    continue
+                try:
+                    payload = loads(raw_line)
+                except ValueError as exc:
+                    errors.append(f"{path}:{idx}: invalid JSON ({getattr(exc, 'msg', exc)})")
+                    continue
+                if not isinstance(payload, dict):
+                    errors.append(f"{path}:{idx}: expected JSON object per line")
+                    continue
+                yield idx, payload
+            if not chunk:
+                return
+
+
+def write_jsonl(path: Path, records: Iterable[Any]) -> None:
+    """Write ``records`` to ``path`` as JSON Lines, batching writes into large chunks."""
+
+    buffer: list[bytes] = []
+    buffered = 0
+    with open(path, "wb") as handle:
+        for record in records:
+            line = _dump_line(record)
+            buffer.append(line)
+            buffered += len(line)
+            if buffered >= _WRITE_FLUSH_SIZE:
+                handle.write(b"".join(buffer))
+                buffer.clear()
+                buffered = 0
+        handle.write(b"".join(buffer))
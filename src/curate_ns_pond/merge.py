@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Sequence
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Sequence
 
+from .jsonl import iter_jsonl
 from .resolution import IdentifierKind, NormalizedIdentifier, normalize_identifier
-from .storage import hash_file_contents
+from .storage import combine_file_digests, new_content_hasher, sorted_paths
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from hashlib import _Hash
 
 __all__ = ["MergeOutcome", "merge_jsonl_files"]
 
@@ -23,48 +26,49 @@ class MergeOutcome:
     errors: list[str]
 
 
-def _read_jsonl(path: Path, errors: list[str]) -> list[dict[str, str | None]]:
-    records: list[dict[str, str | None]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for idx, raw_line in enumerate(handle, start=1):
-            line = raw_line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError as exc:
-                errors.append(f"{path}:{idx}: invalid JSON ({exc.msg})")
-                continue
-            if not isinstance(payload, dict):
-                errors.append(f"{path}:{idx}: expected JSON object per line")
-                continue
-            record = {
-                "pmid": payload.get("pmid"),
-                "pmcid": payload.get("pmcid"),
-                "doi": payload.get("doi"),
-            }
-            if not any(record.values()):
-                errors.append(f"{path}:{idx}: row has no recognizable identifiers")
-                continue
-            records.append(record)
-    return records
+def _iter_records(
+    path: Path, errors: list[str], hasher: _Hash | None = None
+) -> Iterator[dict[str, str | None]]:
+    for idx, payload in iter_jsonl(path, errors, hasher):
+        record = {
+            "pmid": payload.get("pmid"),
+            "pmcid": payload.get("pmcid"),
+            "doi": payload.get("doi"),
+        }
+        if not any(record.values()):
+            errors.append(f"{path}:{idx}: row has no recognizable identifiers")
+            continue
+        yield record
 
 
 def _group_identifiers(records: Iterable[list[NormalizedIdentifier]]) -> dict[str, Dict[IdentifierKind, set[str]]]:
     parent: dict[str, str] = {}
+    rank: dict[str, int] = {}
     key_to_identifier: dict[str, NormalizedIdentifier] = {}
 
     def find(key: str) -> str:
-        parent.setdefault(key, key)
-        if parent[key] != key:
-            parent[key] = find(parent[key])
-        return parent[key]
+        if key not in parent:
+            parent[key] = key
+            rank[key] = 0
+            return key
+        root = key
+        while parent[root] != root:
+            root = parent[root]
+        # Second pass: point every node on the path directly at the root.
+        while parent[key] != root:
+            parent[key], key = root, parent[key]
+        return root
 
     def union(a: str, b: str) -> None:
         root_a = find(a)
         root_b = find(b)
-        if root_a != root_b:
-            parent[root_b] = root_a
+        if root_a == root_b:
+            return
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
 
     for identifiers in records:
         if not identifiers:
@@ -91,29 +95,33 @@ def merge_jsonl_files(paths: Sequence[Path]) -> MergeOutcome:
         raise ValueError("At least one JSONL file is required")
 
     errors: list[str] = []
-    normalized_records: list[list[NormalizedIdentifier]] = []
-
-    ordered_paths = sorted(paths, key=lambda item: item.as_posix())
-    for path in ordered_paths:
-        extracted = _read_jsonl(path, errors)
-        for record in extracted:
-            identifiers: list[NormalizedIdentifier] = []
-            for key in ("pmid", "pmcid", "doi"):
-                value = record.get(key)
-                if value is None or (isinstance(value, str) and not value.strip()):
-                    continue
-                try:
-                    identifiers.append(normalize_identifier(str(value)))
-                except ValueError as exc:
-                    errors.append(f"{path}: {exc}")
-            if identifiers:
-                normalized_records.append(identifiers)
-            else:
-                errors.append(
-                    f"{path}: record discarded after normalization due to missing identifiers"
-                )
-
-    components = _group_identifiers(normalized_records)
+    ordered_paths = sorted_paths(paths)
+
+    # Inputs are hashed while they are parsed rather than in a second read.
+    file_digests: list[str] = []
+
+    def normalized_records() -> Iterator[list[NormalizedIdentifier]]:
+        for path in ordered_paths:
+            hasher = new_content_hasher()
+            for record in _iter_records(path, errors, hasher):
+                identifiers: list[NormalizedIdentifier] = []
+                for key in ("pmid", "pmcid", "doi"):
+                    value = record.get(key)
+                    if value is None or (isinstance(value, str) and not value.strip()):
+                        continue
+                    try:
+                        identifiers.append(normalize_identifier(str(value)))
+                    except ValueError as exc:
+                        errors.append(f"{path}: {exc}")
+                if identifiers:
+                    yield identifiers
+                else:
+                    errors.append(
+                        f"{path}: record discarded after normalization due to missing identifiers"
+                    )
+            file_digests.append(hasher.hexdigest())
+
+    components = _group_identifiers(normalized_records())
 
     sortable_records: list[tuple[str, dict[str, str | None]]] = []
 
@@ -139,7 +147,7 @@ def merge_jsonl_files(paths: Sequence[Path]) -> MergeOutcome:
 
     outcome = MergeOutcome(
         records=merged_records,
-        input_hash=hash_file_contents(paths),
+        input_hash=combine_file_digests(file_digests),
         source_files=[str(path) for path in ordered_paths],
         errors=errors,
     )
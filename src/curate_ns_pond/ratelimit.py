@@ -0,0 +1,82 @@
+"""Client-side rate limiting for external services."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+__all__ = ["NCBI_HOST", "TokenBucket", "ncbi_rate", "shared_bucket"]
+
+NCBI_HOST = "eutils.ncbi.nlm.nih.gov"
+
+_BUCKETS: dict[str, "TokenBucket"] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+class TokenBucket:
+    """Thread-safe token bucket that blocks callers until a request may be sent."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        capacity = rate if capacity is None else capacity
+        if capacity < 1:
+            raise ValueError("capacity must allow at least one token")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Consume one token, sleeping until it becomes available."""
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def slow_down(self, rate: float) -> None:
+        """Lower the refill rate (and capacity) to ``rate`` if it is slower."""
+
+        with self._lock:
+            if rate < self.rate:
+                self.rate = rate
+                self.capacity = min(self.capacity, rate)
+                self._tokens = min(self._tokens, self.capacity)
+
+    def __enter__(self) -> "TokenBucket":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+def ncbi_rate(api_key: str | None) -> float:
+    """Return the documented NCBI request ceiling (requests per second)."""
+
+    return 10.0 if api_key else 3.0
+
+
+def shared_bucket(host: str, rate: float) -> TokenBucket:
+    """Return the process-wide bucket for ``host`` so every client shares one budget.
+
+    When clients register different rates for the same host the lowest one wins, so a
+    client without an API key can never push the shared budget above its own ceiling.
+    """
+
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(host)
+        if bucket is None:
+            bucket = _BUCKETS[host] = TokenBucket(rate)
+        elif rate < bucket.rate:
+            bucket.slow_down(rate)
+        return bucket
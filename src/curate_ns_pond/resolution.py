@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+import asyncio
+import time
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 from .services.entrez import EntrezError, EntrezSummaryClient
 from .services.pmc import PMCError, PMCIdConverter
 from .services.semantic_scholar import SemanticScholarClient, SemanticScholarError
 
 _PMC_PREFIX = "PMC"
+# Normalizers are pure, so repeated identifiers across merges and runs in one
+# process are served from these caches. Invalid input raises and is not cached.
+_NORMALIZE_CACHE_SIZE = 65536
+
 
 class IdentifierKind(str, Enum):
     PMID = "pmid"
@@ -46,9 +53,16 @@ class ResolutionResult:
     records: list[ResolvedRecord]
     sources_used: set[str]
     errors: list[str]
-    started_at: datetime
+    started_at_ns: int
+
+    @property
+    def started_at(self) -> datetime:
+        """Wall-clock start of the run as an aware UTC datetime."""
+
+        return datetime.fromtimestamp(self.started_at_ns / 1e9, tz=timezone.utc)
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_pmid(value: str) -> str:
     candidate = value.strip()
     if not candidate:
@@ -58,36 +72,39 @@ def normalize_pmid(value: str) -> str:
     return candidate
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_pmcid(value: str) -> str:
-    candidate = value.strip().upper()
-    if candidate.startswith("PMCID:"):
-        candidate = candidate.split(":", 1)[1]
-    if not candidate.startswith(_PMC_PREFIX):
-        candidate = f"{_PMC_PREFIX}{candidate}"
-    number_part = candidate[len(_PMC_PREFIX) :]
-    if not number_part.isdigit():
+    candidate = value.strip()
+    # Only the ASCII prefix is case-insensitive, so upper-case just that slice.
+    if candidate[:6].upper() == "PMCID:":
+        candidate = candidate[6:]
+    if candidate[:3].upper() == _PMC_PREFIX:
+        candidate = candidate[3:]
+    if not candidate.isdigit():
         raise ValueError(f"Invalid PMCID: {value}")
-    return f"{_PMC_PREFIX}{number_part}"
+    return f"{_PMC_PREFIX}{candidate}"
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_doi(value: str) -> str:
     candidate = value.strip()
-    if candidate.lower().startswith("doi:"):
-        candidate = candidate.split(":", 1)[1]
+    if candidate[:4].lower() == "doi:":
+        candidate = candidate[4:]
     if "/" not in candidate:
         raise ValueError(f"Invalid DOI: {value}")
     return candidate.lower()
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_identifier(value: str) -> NormalizedIdentifier:
     raw = value.strip()
     if not raw:
         raise ValueError("Identifier cannot be blank")
-    lowered = raw.lower()
-    if lowered.startswith("pmid:"):
-        raw = raw.split(":", 1)[1]
-        return NormalizedIdentifier(IdentifierKind.PMID, normalize_pmid(raw), value)
-    if lowered.startswith("pmcid:") or lowered.startswith("pmc"):
+    # Prefixes are ASCII and case-insensitive; lower-case only the few leading characters.
+    prefix = raw[:5].lower()
+    if prefix == "pmid:":
+        return NormalizedIdentifier(IdentifierKind.PMID, normalize_pmid(raw[5:]), value)
+    if prefix.startswith("pmc"):  # also covers "pmcid:"
         return NormalizedIdentifier(IdentifierKind.PMCID, normalize_pmcid(raw), value)
     if raw.isdigit():
         return NormalizedIdentifier(IdentifierKind.PMID, normalize_pmid(raw), value)
@@ -96,13 +113,6 @@ def normalize_identifier(value: str) -> NormalizedIdentifier:
     raise ValueError(f"Unrecognized identifier: {value}")
 
 
-_ATTR_KIND = {
-    "pmid": IdentifierKind.PMID,
-    "pmcid": IdentifierKind.PMCID,
-    "doi": IdentifierKind.DOI,
-}
-
-
 def _normalize_value(kind: IdentifierKind, value: str) -> str:
     if kind is IdentifierKind.PMID:
         return normalize_pmid(value)
@@ -114,61 +124,100 @@ def _normalize_value(kind: IdentifierKind, value: str) -> str:
 
 
 class _ResolutionState:
+    """Union-find over integer record handles.
+
+    Identifiers live in one column per kind, indexed by handle. Records are
+    append-only; merging links one handle under another, and only root handles
+    are materialized as :class:`ResolvedRecord` objects.
+    """
+
     def __init__(self) -> None:
-        self.records: list[ResolvedRecord] = []
-        self.index: dict[tuple[IdentifierKind, str], ResolvedRecord] = {}
+        self._columns: dict[IdentifierKind, list[str | None]] = {
+            kind: [] for kind in IdentifierKind
+        }
+        self._parent: list[int] = []
+        self._rank: list[int] = []
+        # Output position of each root; a merge keeps the position of the record merged into.
+        self._order: list[int] = []
+        self.index: dict[tuple[IdentifierKind, str], int] = {}
+        # Service responses repeat the same raw values; normalize each one only once.
+        self._keys: dict[tuple[IdentifierKind, str], tuple[IdentifierKind, str]] = {}
 
-    def ensure_record(self, kind: IdentifierKind, value: str) -> ResolvedRecord:
-        normalized = _normalize_value(kind, value)
-        key = (kind, normalized)
+    @property
+    def records(self) -> list[ResolvedRecord]:
+        parent = self._parent
+        roots = sorted(
+            (handle for handle in range(len(parent)) if parent[handle] == handle),
+            key=self._order.__getitem__,
+        )
+        pmids = self._columns[IdentifierKind.PMID]
+        pmcids = self._columns[IdentifierKind.PMCID]
+        dois = self._columns[IdentifierKind.DOI]
+        return [ResolvedRecord(pmids[handle], pmcids[handle], dois[handle]) for handle in roots]
+
+    def find(self, handle: int) -> int:
+        parent = self._parent
+        root = handle
+        while parent[root] != root:
+            root = parent[root]
+        while parent[handle] != root:
+            parent[handle], handle = root, parent[handle]
+        return root
+
+    def _key(self, kind: IdentifierKind, value: str) -> tuple[IdentifierKind, str]:
+        raw = (kind, value)
+        key = self._keys.get(raw)
+        if key is None:
+            key = self._keys[raw] = (kind, _normalize_value(kind, value))
+        return key
+
+    def ensure_record(self, kind: IdentifierKind, value: str) -> int:
+        key = self._key(kind, value)
         existing = self.index.get(key)
         if existing is not None:
-            return existing
-        record = ResolvedRecord()
-        self.records.append(record)
-        self._attach(record, kind, normalized)
-        return record
-
-    def link(self, record: ResolvedRecord, kind: IdentifierKind, value: str) -> ResolvedRecord:
-        normalized = _normalize_value(kind, value)
-        key = (kind, normalized)
+            return self.find(existing)
+        handle = len(self._parent)
+        for column in self._columns.values():
+            column.append(None)
+        self._parent.append(handle)
+        self._rank.append(0)
+        self._order.append(handle)
+        self._attach(handle, key)
+        return handle
+
+    def link(self, handle: int, kind: IdentifierKind, value: str) -> int:
+        key = self._key(kind, value)
+        root = self.find(handle)
         existing = self.index.get(key)
         if existing is None:
-            self._attach(record, kind, normalized)
-            self.index[key] = record
-            return record
-        if existing is record:
-            return record
-        merged = self._merge(existing, record)
-        self._attach(merged, kind, normalized)
-        self.index[key] = merged
+            self._attach(root, key)
+            return root
+        target = self.find(existing)
+        if target == root:
+            return root
+        merged = self._union(target, root)
+        self._attach(merged, key)
         return merged
 
-    def _merge(self, target: ResolvedRecord, other: ResolvedRecord) -> ResolvedRecord:
-        if target is other:
-            return target
-        if other in self.records:
-            self.records.remove(other)
-        for attr in ("pmid", "pmcid", "doi"):
-            value = getattr(other, attr)
-            if value and not getattr(target, attr):
-                setattr(target, attr, value)
-        for attr, kind in _ATTR_KIND.items():
-            value = getattr(target, attr)
-            if value:
-                self.index[(kind, _normalize_value(kind, value))] = target
-        return target
-
-    def _attach(self, record: ResolvedRecord, kind: IdentifierKind, value: str) -> None:
-        if kind is IdentifierKind.PMID:
-            record.pmid = value
-        elif kind is IdentifierKind.PMCID:
-            record.pmcid = value
-        elif kind is IdentifierKind.DOI:
-            record.doi = value
-        else:  # pragma: no cover - defensive
-            raise ValueError(f"Unsupported identifier kind: {kind}")
-        self.index[(kind, value)] = record
+    def _union(self, target: int, other: int) -> int:
+        """Merge ``other`` into ``target``; ``target``'s identifiers take precedence."""
+
+        if self._rank[target] < self._rank[other]:
+            winner, loser = other, target
+        else:
+            winner, loser = target, other
+            if self._rank[target] == self._rank[other]:
+                self._rank[target] += 1
+        for column in self._columns.values():
+            column[winner] = column[target] or column[other]
+        self._parent[loser] = winner
+        self._order[winner] = self._order[target]
+        return winner
+
+    def _attach(self, handle: int, key: tuple[IdentifierKind, str]) -> None:
+        kind, value = key
+        self._columns[kind][handle] = value
+        self.index[key] = handle
 
 
 class IdentifierResolver:
@@ -207,83 +256,133 @@ class IdentifierResolver:
         return self.resolve(normalized)
 
     def resolve(self, identifiers: Sequence[NormalizedIdentifier]) -> ResolutionResult:
+        """Synchronous wrapper around :meth:`aresolve`."""
+
+        return asyncio.run(self.aresolve(identifiers))
+
+    async def aresolve(self, identifiers: Sequence[NormalizedIdentifier]) -> ResolutionResult:
+        """Resolve ``identifiers``, querying PMC and Entrez concurrently."""
+
         state = _ResolutionState()
         sources_used: set[str] = set()
         errors: list[str] = []
-        started_at = datetime.utcnow()
+        started_at_ns = time.time_ns()
 
+        # One pass seeds the records and collects the lookup ids; dict keys drop
+        # duplicates while keeping input order.
+        pmcid_keys: dict[str, None] = {}
+        pmid_keys: dict[str, None] = {}
         for identifier in identifiers:
             state.ensure_record(identifier.kind, identifier.value)
+            if identifier.kind is IdentifierKind.PMCID:
+                pmcid_keys[identifier.value] = None
+            elif identifier.kind is IdentifierKind.PMID:
+                pmid_keys[identifier.value] = None
+        pmcids = list(pmcid_keys)
+        pmids = list(pmid_keys)
+        # Neither lookup needs the other's answer, so both run at once; results are
+        # still applied in a fixed order to keep record merging deterministic.
+        (conversions, pmc_error), (summaries, entrez_error) = await asyncio.gather(
+            _lookup(self._pmc.convert, pmcids, PMCError),
+            _lookup(self._entrez.fetch_article_ids, pmids, EntrezError),
+        )
 
-        pmcids = sorted({ident.value for ident in identifiers if ident.kind is IdentifierKind.PMCID})
-        if pmcids:
-            try:
-                conversions = self._pmc.convert(pmcids)
-                if conversions:
-                    sources_used.add("pmc")
-                for pmcid, payload in conversions.items():
-                    record = state.ensure_record(IdentifierKind.PMCID, pmcid)
-                    pmid = payload.get("pmid")
-                    if pmid:
-                        record = state.link(record, IdentifierKind.PMID, pmid)
-                    doi = payload.get("doi")
-                    if doi:
-                        record = state.link(record, IdentifierKind.DOI, doi)
-            except PMCError as exc:
-                errors.append(str(exc))
-
-        pmids = sorted({
-            record.pmid
-            for record in state.records
-            if record.pmid
-        })
-        if pmids:
-            try:
-                summaries = self._entrez.fetch_article_ids(pmids)
-                if summaries:
-                    sources_used.add("entrez")
-                for pmid, payload in summaries.items():
-                    record = state.ensure_record(IdentifierKind.PMID, pmid)
-                    pmcid = payload.get("pmcid")
-                    if pmcid:
-                        record = state.link(record, IdentifierKind.PMCID, pmcid)
-                    doi = payload.get("doi")
-                    if doi:
-                        state.link(record, IdentifierKind.DOI, doi)
-            except EntrezError as exc:
-                errors.append(str(exc))
-
-        semantic_targets = sorted({
-            (IdentifierKind.PMID, record.pmid)
-            for record in state.records
-            if record.pmid
-        } |
-            {
-                (IdentifierKind.DOI, record.doi)
-                for record in state.records
-                if record.doi
-            }
+        if pmc_error:
+            errors.append(pmc_error)
+        if conversions:
+            sources_used.add("pmc")
+        found_pmids: list[str] = []
+        for pmcid, payload in conversions.items():
+            handle = state.ensure_record(IdentifierKind.PMCID, pmcid)
+            pmid = payload.get("pmid")
+            if pmid:
+                found_pmids.append(pmid)
+                handle = state.link(handle, IdentifierKind.PMID, pmid)
+            doi = payload.get("doi")
+            if doi:
+                handle = state.link(handle, IdentifierKind.DOI, doi)
+
+        if entrez_error:
+            errors.append(entrez_error)
+        if summaries:
+            sources_used.add("entrez")
+        _apply_summaries(state, summaries)
+
+        # PMIDs that PMC found for input PMCIDs were not part of the first Entrez
+        # batch; look them up now so PMCID-only inputs are still checked by Entrez.
+        followup = [pmid for pmid in dict.fromkeys(found_pmids) if pmid not in pmid_keys]
+        summaries, entrez_error = await _lookup(
+            self._entrez.fetch_article_ids, followup, EntrezError
         )
-        for kind, value in semantic_targets:
-            if not value:
-                continue
-            try:
-                data = self._semantic.fetch_external_ids(value)
-            except SemanticScholarError as exc:
-                errors.append(str(exc))
+        if entrez_error:
+            errors.append(entrez_error)
+        if summaries:
+            sources_used.add("entrez")
+        _apply_summaries(state, summaries)
+
+        # Semantic Scholar only fills gaps: records PMC and Entrez fully resolved are
+        # skipped, and every other record is probed once, by DOI when it has one.
+        # Prefixed identifiers let one batch request cover every probe.
+        semantic_ids: dict[str, tuple[IdentifierKind, str]] = {}
+        for record in state.records:
+            if record.pmid and record.pmcid and record.doi:
                 continue
+            if record.doi:
+                semantic_ids[f"DOI:{record.doi}"] = (IdentifierKind.DOI, record.doi)
+            elif record.pmid:
+                semantic_ids[f"PMID:{record.pmid}"] = (IdentifierKind.PMID, record.pmid)
+        external_ids, semantic_error = await _lookup(
+            self._semantic.fetch_external_ids_batch, list(semantic_ids), SemanticScholarError
+        )
+        if semantic_error:
+            errors.append(semantic_error)
+        for semantic_id, (kind, value) in semantic_ids.items():
+            data = external_ids.get(semantic_id)
             if not data:
                 continue
             sources_used.add("semantic-scholar")
-            record = state.ensure_record(kind, value)
+            handle = state.ensure_record(kind, value)
             pmid = data.get("pmid")
             if pmid:
-                record = state.link(record, IdentifierKind.PMID, pmid)
+                handle = state.link(handle, IdentifierKind.PMID, pmid)
             pmcid = data.get("pmcid")
             if pmcid:
-                record = state.link(record, IdentifierKind.PMCID, pmcid)
+                handle = state.link(handle, IdentifierKind.PMCID, pmcid)
             doi = data.get("doi")
             if doi:
-                state.link(record, IdentifierKind.DOI, doi)
+                state.link(handle, IdentifierKind.DOI, doi)
+
+        return ResolutionResult(
+            records=state.records,
+            sources_used=sources_used,
+            errors=errors,
+            started_at_ns=started_at_ns,
+        )
+
 
-        return ResolutionResult(records=state.records.copy(), sources_used=sources_used, errors=errors, started_at=started_at)
+def _apply_summaries(state: _ResolutionState, summaries: dict[str, Any]) -> None:
+    """Link the PMCIDs and DOIs Entrez reported onto each PMID's record."""
+
+    for pmid, payload in summaries.items():
+        handle = state.ensure_record(IdentifierKind.PMID, pmid)
+        pmcid = payload.get("pmcid")
+        if pmcid:
+            handle = state.link(handle, IdentifierKind.PMCID, pmcid)
+        doi = payload.get("doi")
+        if doi:
+            state.link(handle, IdentifierKind.DOI, doi)
+
+
+async def _lookup(
+    fetch: Callable[[list[str]], dict[str, Any]],
+    values: list[str],
+    error_type: type[Exception],
+) -> tuple[dict[str, Any], str | None]:
+    """Run a blocking batch lookup in a worker thread, capturing its service error."""
+
+    if not values:
+        return {}, None
+    try:
+        return await asyncio.to_thread(fetch, values), None
+    except error_type as exc:
+        return {}, str(exc)
@@ -0,0 +1,46 @@
+"""Helpers for splitting identifier lookups into bounded requests."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Sequence, TypeVar
+
+__all__ = ["MAX_CONCURRENT_CHUNKS", "chunked", "fetch_chunks"]
+
+T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Matches NCBI's keyed rate limit; the per-host token buckets still pace the requests.
+MAX_CONCURRENT_CHUNKS = 10
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[list[T]]:
+    """Yield consecutive slices of ``items`` holding at most ``size`` entries."""
+
+    if size < 1:
+        raise ValueError("size must be positive")
+    for start in range(0, len(items), size):
+        yield list(items[start : start + size])
+
+
+def fetch_chunks(
+    fetch: Callable[[list[T]], dict[K, V]],
+    items: Sequence[T],
+    size: int,
+    max_workers: int = MAX_CONCURRENT_CHUNKS,
+) -> dict[K, V]:
+    """Call ``fetch`` once per chunk of ``items``, concurrently, and merge the results.
+
+    Results are merged in chunk order, so the output does not depend on which
+    request finishes first. The first failing chunk's exception propagates.
+    """
+
+    chunks = list(chunked(items, size))
+    if len(chunks) <= 1:
+        return fetch(chunks[0]) if chunks else {}
+    merged: dict[K, V] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+        for result in pool.map(fetch, chunks):
+            merged.update(result)
+    return merged
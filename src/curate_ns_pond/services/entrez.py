@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import re
 from typing import Iterable
 
 import httpx
 
+from ..jsonl import loads
+from ..ratelimit import NCBI_HOST, TokenBucket, ncbi_rate, shared_bucket
+from .batching import fetch_chunks
+from .cache import LRUCache
+from .transport import build_client
+
+_PMC_RE = re.compile(r"PMC\d+")
+
 
 class EntrezError(RuntimeError):
     """Raised when Entrez requests fail."""
@@ -18,38 +26,62 @@ class EntrezSummaryClient:
     email: str | None = None
     tool: str = "CurateNSPond"
     timeout: float = 30.0
+    api_key: str | None = None
+    rate_limiter: TokenBucket | None = None
     _client: httpx.Client | None = None
+    _summary_cache: LRUCache[str, dict[str, object]] = field(default_factory=LRUCache, repr=False)
+    _base_params: dict[str, str] = field(init=False, repr=False)
 
     BASE_URL: str = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
 
     def __post_init__(self) -> None:
+        if self.rate_limiter is None:
+            self.rate_limiter = shared_bucket(NCBI_HOST, ncbi_rate(self.api_key))
+        # Everything but the id list is fixed for the client's lifetime.
+        self._base_params = {"db": "pubmed", "retmode": "json", "tool": self.tool}
+        if self.email:
+            self._base_params["email"] = self.email
+        if self.api_key:
+            self._base_params["api_key"] = self.api_key
+
+    @property
+    def client(self) -> httpx.Client:
+        """HTTP client, created on first use so unused clients hold no resources."""
+
         if self._client is None:
-            self._client = httpx.Client(timeout=self.timeout)
+            self._client = build_client(timeout=self.timeout)
+        return self._client
 
     def close(self) -> None:
+        self._summary_cache.clear()
         if self._client is not None:
             self._client.close()
 
-    def _fetch_summary(self, pmids: Iterable[str]) -> dict[str, dict[str, object]]:
+    def _fetch_summary(
+        self, pmids: Iterable[str], chunk: int = 200
+    ) -> dict[str, dict[str, object]]:
         pmid_list = [str(pmid) for pmid in pmids if pmid]
         if not pmid_list:
             return {}
-        params = {
-            "db": "pubmed",
-            "id": ",".join(pmid_list),
-            "retmode": "json",
-            "tool": self.tool,
-        }
-        if self.email:
-            params["email"] = self.email
+        cached = self._summary_cache.get_many(pmid_list)
+        missing = list(dict.fromkeys(pmid for pmid in pmid_list if pmid not in cached))
+        if missing:
+            # esummary ids travel in the URL; ``chunk`` keeps each request well short
+            # of URL length limits, and the chunks are requested concurrently.
+            cached.update(fetch_chunks(self._request_summary, missing, chunk))
+        return {pmid: cached[pmid] for pmid in pmid_list if pmid in cached}
+
+    def _request_summary(self, pmid_list: list[str]) -> dict[str, dict[str, object]]:
+        params = self._base_params | {"id": ",".join(pmid_list)}
         try:
-            response = self._client.get(self.BASE_URL, params=params)
+            with self.rate_limiter:
+                response = self.client.get(self.BASE_URL, params=params)
         except httpx.HTTPError as exc:  # pragma: no cover - defensive
             raise EntrezError("entrez: request failed") from exc
         if response.status_code >= 400:
             raise EntrezError(f"entrez: error {response.status_code}")
         try:
-            payload = response.json()
+            payload = loads(response.content)
         except ValueError as exc:  # pragma: no cover - defensive
             raise EntrezError("entrez: invalid JSON response") from exc
         result = payload.get("result")
@@ -60,6 +92,7 @@ class EntrezSummaryClient:
             entry = result.get(pmid)
             if isinstance(entry, dict):
                 summaries[pmid] = entry
+                self._summary_cache.put(pmid, entry)
         return summaries
 
     def fetch_article_ids(self, pmids: Iterable[str]) -> dict[str, dict[str, str]]:
@@ -89,21 +122,33 @@ class EntrezSummaryClient:
 
     @staticmethod
     def _normalize_pmcid(value: str) -> str | None:
-        candidate = value.strip()
+        candidate = value.strip().upper()
         if not candidate:
             return None
-        match = re.search(r"PMC\d+", candidate.upper())
+        match = _PMC_RE.search(candidate)
         if match:
             return match.group(0)
-        if candidate.upper().startswith("PMC"):
-            return candidate.upper()
+        if candidate.startswith("PMC"):
+            return candidate
         return None
 
     def fetch_metadata(self, pmid: str) -> dict[str, object] | None:
-        summaries = self._fetch_summary([pmid])
-        entry = summaries.get(pmid)
-        if not entry:
-            return None
+        return self.fetch_metadata_batch([pmid]).get(pmid)
+
+    def fetch_metadata_batch(
+        self, pmids: Iterable[str], chunk: int = 200
+    ) -> dict[str, dict[str, object]]:
+        """Fetch bibliographic metadata for many PMIDs using one request per ``chunk`` ids."""
+
+        pmid_list = list(dict.fromkeys(str(pmid) for pmid in pmids if pmid))
+        metadata: dict[str, dict[str, object]] = {}
+        for pmid, entry in self._fetch_summary(pmid_list, chunk).items():
+            if entry:
+                metadata[pmid] = self._metadata_from_summary(entry)
+        return metadata
+
+    @staticmethod
+    def _metadata_from_summary(entry: dict[str, object]) -> dict[str, object]:
         authors = []
         raw_authors = entry.get("authors", [])
         if isinstance(raw_authors, list):
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-import json
+from dataclasses import dataclass, field
 from typing import Iterable
-from urllib.parse import urlencode
-from urllib.request import urlopen
 
 import httpx
 
+from ..jsonl import loads
+from .batching import fetch_chunks
+from .transport import build_client
+
 
 class PMCError(RuntimeError):
     """Raised when PMC identifier conversion fails."""
@@ -21,28 +22,40 @@ class PMCIdConverter:
     tool: str = "CurateNSPond"
     timeout: float = 30.0
     _client: httpx.Client | None = None
+    _base_params: dict[str, str] = field(init=False, repr=False)
 
     BASE_URL: str = "https://www.ncbi.nlm.nih.gov/pmc/utils/idconv/v1.0/"
 
     def __post_init__(self) -> None:
+        self._base_params = {"format": "json", "tool": self.tool}
+        if self.email:
+            self._base_params["email"] = self.email
+
+    @property
+    def client(self) -> httpx.Client:
+        """HTTP client, created on first use so unused clients hold no resources."""
+
         if self._client is None:
-            self._client = httpx.Client(timeout=self.timeout)
+            # The idconv service rejects anonymous clients with 403; identify ourselves.
+            contact = self.email or "no contact email"
+            headers = {"User-Agent": f"{self.tool}/1.0 ({contact})"}
+            self._client = build_client(timeout=self.timeout, headers=headers)
+        return self._client
 
     def close(self) -> None:
         if self._client is not None:
             self._client.close()
 
-    def convert(self, pmcids: Iterable[str]) -> dict[str, dict[str, str]]:
+    def convert(self, pmcids: Iterable[str], chunk: int = 200) -> dict[str, dict[str, str]]:
+        """Convert PMCIDs to PMIDs and DOIs, requesting up to ``chunk`` ids at a time."""
+
         pmcid_list = [str(pmcid) for pmcid in pmcids if pmcid]
         if not pmcid_list:
             return {}
-        params = {
-            "ids": ",".join(pmcid_list),
-            "format": "json",
-            "tool": self.tool,
-        }
-        if self.email:
-            params["email"] = self.email
+        return fetch_chunks(self._convert_chunk, pmcid_list, chunk)
+
+    def _convert_chunk(self, pmcid_list: list[str]) -> dict[str, dict[str, str]]:
+        params = self._base_params | {"ids": ",".join(pmcid_list)}
         payload = self._fetch_payload(params)
         records = payload.get("records", [])
         if not isinstance(records, list):
@@ -64,22 +77,16 @@ class PMCIdConverter:
 
     def _fetch_payload(self, params: dict[str, str]) -> dict[str, object]:
         try:
-            response = self._client.get(self.BASE_URL, params=params, follow_redirects=True)
+            response = self.client.get(self.BASE_URL, params=params, follow_redirects=True)
         except httpx.HTTPError as exc:  # pragma: no cover - network failure
             raise PMCError("pmc: request failed") from exc
         if response.status_code == 403:
-            return self._fetch_with_urllib(params)
+            raise PMCError(
+                "pmc: error 403 (request rejected; pass an email so NCBI can identify the tool)"
+            )
         if response.status_code >= 400:
             raise PMCError(f"pmc: error {response.status_code}")
         try:
-            return response.json()
-        except ValueError:
-            return self._fetch_with_urllib(params)
-
-    def _fetch_with_urllib(self, params: dict[str, str]) -> dict[str, object]:
-        url = f"{self.BASE_URL}?{urlencode(params)}"
-        try:
-            with urlopen(url, timeout=self.timeout) as response:  # type: ignore[call-arg]
-                return json.load(response)
-        except Exception as exc:  # pragma: no cover - defensive
+            return loads(response.content)
+        except ValueError as exc:
             raise PMCError("pmc: invalid JSON response") from exc
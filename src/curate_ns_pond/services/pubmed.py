@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Iterable, Optional
+from typing import Iterable
 
 import httpx
 
+from ..jsonl import loads
+from ..ratelimit import NCBI_HOST, TokenBucket, ncbi_rate, shared_bucket
+from .transport import build_client
+
 __all__ = ["PubMedError", "PubMedSearchService"]
 
 
@@ -24,14 +28,27 @@ class PubMedSearchService:
     tool: str = "CurateNSPond"
     retmax: int = 1000
     timeout: float = 30.0
+    fetch_retmax: int = 10000
+    rate_limiter: TokenBucket | None = None
     _client: httpx.Client | None = None
+    _identity: dict[str, str] = field(init=False, repr=False)
 
     BASE_URL: str = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+    FETCH_URL: str = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+
+    def __post_init__(self) -> None:
+        if self.rate_limiter is None:
+            self.rate_limiter = shared_bucket(NCBI_HOST, ncbi_rate(self.api_key))
+        self._identity = {"tool": self.tool}
+        if self.api_key:
+            self._identity["api_key"] = self.api_key
+        if self.email:
+            self._identity["email"] = self.email
 
     def _get_client(self) -> tuple[httpx.Client, bool]:
         if self._client is not None:
             return self._client, False
-        client = httpx.Client(timeout=self.timeout)
+        client = build_client(timeout=self.timeout)
         return client, True
 
     def _build_params(
@@ -39,20 +56,15 @@ class PubMedSearchService:
         query: str,
         start_date: date | None,
         end_date: date | None,
-        retstart: int,
     ) -> dict[str, str]:
         params: dict[str, str] = {
             "db": "pubmed",
             "term": query,
             "retmode": "json",
             "retmax": str(self.retmax),
-            "retstart": str(retstart),
-            "tool": self.tool,
+            "usehistory": "y",
+            **self._identity,
         }
-        if self.api_key:
-            params["api_key"] = self.api_key
-        if self.email:
-            params["email"] = self.email
         if start_date is not None or end_date is not None:
             params["datetype"] = "pdat"
         if start_date is not None:
@@ -61,50 +73,78 @@ class PubMedSearchService:
             params["maxdate"] = end_date.isoformat()
         return params
 
+    def _build_fetch_params(self, webenv: str, query_key: str, retstart: int) -> dict[str, str]:
+        return {
+            "db": "pubmed",
+            "WebEnv": webenv,
+            "query_key": query_key,
+            "rettype": "uilist",
+            "retmode": "text",
+            "retstart": str(retstart),
+            "retmax": str(self.fetch_retmax),
+            **self._identity,
+        }
+
+    def _get(self, client: httpx.Client, url: str, params: dict[str, str]) -> httpx.Response:
+        try:
+            with self.rate_limiter:
+                response = client.get(url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise PubMedError("Failed to query PubMed") from exc
+        return response
+
     def search_pmids(
         self,
         query: str,
         start_date: date | None = None,
         end_date: date | None = None,
     ) -> list[str]:
-        client, should_close = self._get_client()
-        try:
-            retstart = 0
-            total_count: Optional[int] = None
-            pmids: list[str] = []
-
-            while True:
-                params = self._build_params(query, start_date, end_date, retstart)
-                try:
-                    response = client.get(self.BASE_URL, params=params)
-                    response.raise_for_status()
-                    data = response.json()
-                except (httpx.HTTPError, ValueError) as exc:  # ValueError covers invalid JSON
-                    raise PubMedError("Failed to query PubMed") from exc
-
-                esearch = data.get("esearchresult")
-                if not isinstance(esearch, dict):
-                    raise PubMedError("Unexpected PubMed response structure")
-
-                idlist = esearch.get("idlist", [])
-                if not isinstance(idlist, Iterable):
-                    raise PubMedError("Unexpected PubMed id list structure")
-
-                batch = [str(identifier) for identifier in idlist]
-                pmids.extend(batch)
+        """Return every PMID matching ``query``.
 
-                if total_count is None:
-                    try:
-                        total_count = int(esearch.get("count", len(pmids)))
-                    except (TypeError, ValueError) as exc:  # pragma: no cover - defensive
-                        raise PubMedError("Invalid count in PubMed response") from exc
+        The search runs once with ``usehistory=y``; any hits beyond the first page
+        are then read from the server-side result set as plain-text id lists.
+        """
 
+        client, should_close = self._get_client()
+        try:
+            params = self._build_params(query, start_date, end_date)
+            response = self._get(client, self.BASE_URL, params)
+            try:
+                data = loads(response.content)
+            except ValueError as exc:
+                raise PubMedError("Failed to query PubMed") from exc
+
+            esearch = data.get("esearchresult")
+            if not isinstance(esearch, dict):
+                raise PubMedError("Unexpected PubMed response structure")
+
+            idlist = esearch.get("idlist", [])
+            if not isinstance(idlist, Iterable):
+                raise PubMedError("Unexpected PubMed id list structure")
+
+            pmids = [str(identifier) for identifier in idlist]
+
+            try:
+                total_count = int(esearch.get("count", len(pmids)))
+            except (TypeError, ValueError) as exc:  # pragma: no cover - defensive
+                raise PubMedError("Invalid count in PubMed response") from exc
+
+            if not pmids or len(pmids) >= total_count:
+                return pmids
+
+            webenv = esearch.get("webenv")
+            query_key = esearch.get("querykey")
+            if not webenv or not query_key:
+                raise PubMedError("PubMed response did not include a search history session")
+
+            while len(pmids) < total_count:
+                params = self._build_fetch_params(webenv, str(query_key), len(pmids))
+                response = self._get(client, self.FETCH_URL, params)
+                batch = response.text.split()
                 if not batch:
                     break
-
-                retstart += len(batch)
-                if retstart >= total_count:
-                    break
+                pmids.extend(batch)
 
             return pmids
         finally:
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Sequence
 from urllib.parse import quote
 
 import httpx
 
+from ..jsonl import loads
+from .cache import LRUCache
+from .transport import build_client
+
+# Identifier names in ``externalIds`` mapped to the keys the resolver uses.
+_EXTERNAL_ID_KEYS = {
+    "PMID": "pmid",
+    "pmid": "pmid",
+    "PMCID": "pmcid",
+    "pmcid": "pmcid",
+    "DOI": "doi",
+    "doi": "doi",
+}
+
 
 class SemanticScholarError(RuntimeError):
     """Raised when Semantic Scholar data cannot be retrieved."""
@@ -18,63 +32,87 @@ class SemanticScholarClient:
     api_key: str | None = None
     timeout: float = 30.0
     _client: httpx.Client | None = None
+    # Answers (including "not found") per prefixed identifier, so ids reached
+    # again through another source within a session are not re-requested.
+    _external_ids_cache: LRUCache[str, dict[str, str] | None] = field(
+        default_factory=LRUCache, repr=False
+    )
 
     BASE_URL: str = "https://api.semanticscholar.org/graph/v1"
+    METADATA_FIELDS: str = "title,abstract,authors,venue,journal,year"
+
+    @property
+    def client(self) -> httpx.Client:
+        """HTTP client, created on first use so unused clients hold no resources."""
 
-    def __post_init__(self) -> None:
         if self._client is None:
             headers = {"User-Agent": "CurateNSPond/identifier-resolver"}
             if self.api_key:
                 headers["x-api-key"] = self.api_key
-            self._client = httpx.Client(timeout=self.timeout, headers=headers)
+            self._client = build_client(timeout=self.timeout, headers=headers)
+        return self._client
 
     def close(self) -> None:
+        self._external_ids_cache.clear()
         if self._client is not None:
             self._client.close()
 
     def fetch_external_ids(self, identifier: str) -> dict[str, str] | None:
-        assert self._client is not None  # for mypy
+        cached = self._external_ids_cache.get_many([identifier])
+        if identifier in cached:
+            return cached[identifier]
         safe_identifier = quote(identifier, safe="")
         url = f"{self.BASE_URL}/paper/{safe_identifier}"
         try:
-            response = self._client.get(url, params={"fields": "externalIds"})
+            response = self.client.get(url, params={"fields": "externalIds"})
         except httpx.HTTPError as exc:  # pragma: no cover - network failure
             raise SemanticScholarError(f"semantic-scholar: failed to fetch {identifier}") from exc
         if response.status_code == 404:
+            self._external_ids_cache.put(identifier, None)
             return None
         if response.status_code >= 400:
             raise SemanticScholarError(
                 f"semantic-scholar: error {response.status_code} for {identifier}"
             )
         try:
-            payload = response.json()
+            payload = loads(response.content)
         except ValueError as exc:  # pragma: no cover - defensive
             raise SemanticScholarError("semantic-scholar: invalid JSON response") from exc
-        external_ids = payload.get("externalIds")
-        if not isinstance(external_ids, dict):
-            return None
-        result: dict[str, str] = {}
-        for key in ("PMID", "pmid"):
-            if key in external_ids and external_ids[key]:
-                result["pmid"] = str(external_ids[key])
-                break
-        for key in ("PMCID", "pmcid"):
-            if key in external_ids and external_ids[key]:
-                result["pmcid"] = str(external_ids[key])
-                break
-        for key in ("DOI", "doi"):
-            if key in external_ids and external_ids[key]:
-                result["doi"] = str(external_ids[key])
-                break
-        return result if result else None
+        external_ids = self._external_ids_from_payload(payload)
+        self._external_ids_cache.put(identifier, external_ids)
+        return external_ids
+
+    def fetch_external_ids_batch(
+        self, identifiers: Sequence[str], chunk: int = 500
+    ) -> dict[str, dict[str, str]]:
+        """Fetch external identifiers for many papers via the ``/paper/batch`` endpoint.
+
+        Identifiers must use Semantic Scholar's prefixed form (``PMID:123``, ``DOI:10.x/y``);
+        results are keyed by the identifier as provided and omit papers that were not found.
+        """
+
+        id_list = list(dict.fromkeys(identifier for identifier in identifiers if identifier))
+        known = self._external_ids_cache.get_many(id_list)
+        missing = [identifier for identifier in id_list if identifier not in known]
+        fetched: dict[str, dict[str, str] | None] = {}
+        for identifier, paper in self._post_batch(missing, "externalIds", chunk):
+            fetched[identifier] = self._external_ids_from_payload(paper)
+        for identifier in missing:
+            known[identifier] = fetched.get(identifier)
+            self._external_ids_cache.put(identifier, known[identifier])
+
+        results: dict[str, dict[str, str]] = {}
+        for identifier in id_list:
+            external_ids = known[identifier]
+            if external_ids:
+                results[identifier] = external_ids
+        return results
 
     def fetch_metadata(self, identifier: str) -> dict[str, Any] | None:
-        assert self._client is not None  # for mypy
         safe_identifier = quote(identifier, safe="")
-        fields = "title,abstract,authors,venue,journal,year"
         url = f"{self.BASE_URL}/paper/{safe_identifier}"
         try:
-            response = self._client.get(url, params={"fields": fields})
+            response = self.client.get(url, params={"fields": self.METADATA_FIELDS})
         except httpx.HTTPError as exc:  # pragma: no cover - network failure
             raise SemanticScholarError(f"semantic-scholar: failed to fetch {identifier}") from exc
         if response.status_code == 404:
@@ -84,9 +122,67 @@ class SemanticScholarClient:
                 f"semantic-scholar: error {response.status_code} for {identifier}"
             )
         try:
-            payload = response.json()
+            payload = loads(response.content)
         except ValueError as exc:  # pragma: no cover - defensive
             raise SemanticScholarError("semantic-scholar: invalid JSON response") from exc
+        return self._metadata_from_payload(payload)
+
+    def fetch_metadata_batch(
+        self, identifiers: Sequence[str], chunk: int = 500
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch metadata for many papers via the ``/paper/batch`` endpoint.
+
+        Identifiers must use Semantic Scholar's prefixed form (``PMID:123``, ``DOI:10.x/y``);
+        results are keyed by the identifier as provided and omit papers that were not found.
+        """
+
+        results: dict[str, dict[str, Any]] = {}
+        for identifier, paper in self._post_batch(identifiers, self.METADATA_FIELDS, chunk):
+            metadata = self._metadata_from_payload(paper)
+            if metadata:
+                results[identifier] = metadata
+        return results
+
+    def _post_batch(
+        self, identifiers: Sequence[str], fields: str, chunk: int
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        id_list = list(dict.fromkeys(identifier for identifier in identifiers if identifier))
+        url = f"{self.BASE_URL}/paper/batch"
+        for start in range(0, len(id_list), chunk):
+            batch = id_list[start : start + chunk]
+            try:
+                response = self.client.post(url, params={"fields": fields}, json={"ids": batch})
+            except httpx.HTTPError as exc:  # pragma: no cover - network failure
+                raise SemanticScholarError("semantic-scholar: batch request failed") from exc
+            if response.status_code >= 400:
+                raise SemanticScholarError(
+                    f"semantic-scholar: error {response.status_code} for batch request"
+                )
+            try:
+                payload = loads(response.content)
+            except ValueError as exc:  # pragma: no cover - defensive
+                raise SemanticScholarError("semantic-scholar: invalid JSON response") from exc
+            if not isinstance(payload, list):
+                raise SemanticScholarError("semantic-scholar: unexpected batch response")
+            # The batch endpoint answers positionally, with null for unknown papers.
+            for identifier, paper in zip(batch, payload):
+                if isinstance(paper, dict):
+                    yield identifier, paper
+
+    @staticmethod
+    def _external_ids_from_payload(payload: dict[str, Any]) -> dict[str, str] | None:
+        external_ids = payload.get("externalIds")
+        if not isinstance(external_ids, dict):
+            return None
+        result: dict[str, str] = {}
+        for key, value in external_ids.items():
+            name = _EXTERNAL_ID_KEYS.get(key)
+            if name and value and name not in result:
+                result[name] = str(value)
+        return result if result else None
+
+    @staticmethod
+    def _metadata_from_payload(payload: dict[str, Any]) -> dict[str, Any] | None:
         result: dict[str, Any] = {}
         for key in ("title", "abstract", "venue", "journal", "year"):
             if key in payload:
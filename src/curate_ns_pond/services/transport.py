@@ -0,0 +1,120 @@
+"""Shared HTTP connection pool for the service clients."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import httpx
+
+try:  # pragma: no cover - depends on the httpx[http2] extra
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - depends on the httpx[http2] extra
+    HTTP2_AVAILABLE = False
+else:  # pragma: no cover - depends on the httpx[http2] extra
+    HTTP2_AVAILABLE = True
+
+try:  # pragma: no cover - optional dependency
+    import hishel
+    from hishel.httpx import SyncCacheTransport
+except ImportError:  # pragma: no cover - optional dependency
+    hishel = None
+    SyncCacheTransport = None
+
+__all__ = [
+    "HTTP2_AVAILABLE",
+    "build_client",
+    "disable_http_cache",
+    "enable_http_cache",
+    "shared_transport",
+]
+
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=30.0)
+
+_POOL: httpx.HTTPTransport | None = None
+_POOL_LOCK = threading.Lock()
+_CACHE: httpx.BaseTransport | None = None
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Route requests through the process-wide pool; closing a client leaves it open."""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        cache = _CACHE
+        if cache is None:
+            return _pool().handle_request(request)
+        if request.method == "POST":
+            # Batch lookups are POSTs; key them on the request body.
+            request.extensions["hishel_body_key"] = True
+        return cache.handle_request(request)
+
+    def close(self) -> None:
+        return None
+
+
+def _pool() -> httpx.HTTPTransport:
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = httpx.HTTPTransport(http2=HTTP2_AVAILABLE, limits=POOL_LIMITS, retries=2)
+    return _POOL
+
+
+if hishel is not None:  # pragma: no branch - optional dependency
+
+    class _SuccessfulResponses(hishel.BaseFilter[hishel.Response]):
+        """Only cache 200 responses so errors and throttling are retried next run."""
+
+        def needs_body(self) -> bool:
+            return False
+
+        def apply(self, item: hishel.Response, body: bytes | None) -> bool:
+            return item.status_code == 200
+
+
+_SHARED_TRANSPORT = _SharedTransport()
+
+
+def shared_transport() -> httpx.BaseTransport:
+    """Return the transport every service client sends its requests through."""
+
+    return _SHARED_TRANSPORT
+
+
+def build_client(*, timeout: float, headers: dict[str, str] | None = None) -> httpx.Client:
+    """Create a client with its own settings on top of the shared connection pool.
+
+    Every client shares one keep-alive pool, so NCBI's services reuse a single
+    TLS session (multiplexed over HTTP/2 when ``h2`` is installed).
+    """
+
+    return httpx.Client(timeout=timeout, headers=headers, transport=shared_transport())
+
+
+def enable_http_cache(directory: Path, *, ttl: float = 86400.0) -> None:
+    """Serve repeated requests from an on-disk cache stored under ``directory``.
+
+    Successful responses are kept for ``ttl`` seconds regardless of the
+    services' own cache headers, which NCBI and Semantic Scholar rarely send.
+    """
+
+    if hishel is None:
+        raise RuntimeError("HTTP caching requires the 'hishel' package; install the 'cache' extra")
+
+    global _CACHE
+    directory.mkdir(parents=True, exist_ok=True)
+    storage = hishel.SyncSqliteStorage(database_path=directory / "responses.db", default_ttl=ttl)
+    policy = hishel.FilterPolicy(response_filters=[_SuccessfulResponses()])
+    disable_http_cache()
+    _CACHE = SyncCacheTransport(next_transport=_pool(), storage=storage, policy=policy)
+
+
+def disable_http_cache() -> None:
+    """Send requests straight to the network again."""
+
+    global _CACHE
+    cache, _CACHE = _CACHE, None
+    if cache is not None:
+        # Only the storage is ours to close; the wrapped pool stays shared.
+        cache.storage.close()
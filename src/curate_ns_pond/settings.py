@@ -26,9 +26,12 @@ class Directories(BaseModel):
 class PipelineSettings(BaseSettings):
     """Settings that control runtime behavior and filesystem layout."""
 
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+    # populate_by_name lets callers pass ``data_root=...`` directly instead of going
+    # through the environment variable alias.
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", populate_by_name=True)
 
     data_root: Path = Field(default=Path("data"), validation_alias="CURATE_DATA_ROOT")
+    http_cache: bool = Field(default=False, validation_alias="CURATE_HTTP_CACHE")
 
     @property
     def raw_dir(self) -> Path:
@@ -38,6 +41,10 @@ class PipelineSettings(BaseSettings):
     def interim_dir(self) -> Path:
         return self.data_root / "interim"
 
+    @property
+    def http_cache_dir(self) -> Path:
+        return self.interim_dir / "http_cache"
+
     @property
     def processed_dir(self) -> Path:
         return self.data_root / "processed"
@@ -1,19 +1,111 @@
 from __future__ import annotations
 
+import json
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Callable
 
 import pytest
-import vcr
+from typer.testing import CliRunner
+
+from curate_ns_pond import jsonl
+
+
+class _FrozenDatetime(datetime):
+    """``datetime`` whose clock is stopped at 2024-01-15 12:00 UTC."""
+
+    @classmethod
+    def now(cls, tz=None) -> "_FrozenDatetime":
+        moment = cls(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+        return moment if tz is None else moment.astimezone(tz)
+
+
+# ESummary entries carry dozens of fields; cassettes keep only the ones the clients read.
+_ESUMMARY_FIELDS = frozenset(
+    {
+        "uid",
+        "title",
+        "authors",
+        "source",
+        "fulljournalname",
+        "elocationid",
+        "pubdate",
+        "sortpubdate",
+        "articleids",
+    }
+)
+
+
+def _strip_response(response: dict[str, Any]) -> dict[str, Any]:
+    """Drop unused ESummary fields from recorded responses to keep cassettes small."""
+
+    body = response["body"]["string"]
+    if not isinstance(body, bytes) or b'"uids"' not in body:
+        return response
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return response
+    result = payload.get("result") if isinstance(payload, dict) else None
+    if not isinstance(result, dict) or not isinstance(result.get("uids"), list):
+        return response
+    for uid in result["uids"]:
+        entry = result.get(uid)
+        if isinstance(entry, dict):
+            result[uid] = {key: value for key, value in entry.items() if key in _ESUMMARY_FIELDS}
+    response["body"]["string"] = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return response
+
+
+_CASSETTE_DIR = str((Path(__file__).parent / "cassettes").resolve())
+
+# pytest-recording deep-copies this before layering marker kwargs on top, so sharing is safe.
+_VCR_CONFIG: dict[str, object] = {
+    # pytest-recording derives the ".json" cassette suffix from the serializer, so the
+    # conftest never imports vcrpy itself; it loads once the first cassette test runs.
+    "serializer": "json",
+    # Store bodies decompressed; the JSON serializer cannot hold gzip bytes.
+    "decode_compressed_response": True,
+    "before_record_response": _strip_response,
+    "filter_headers": ("user-agent", "x-api-key", "authorization"),
+    "filter_query_parameters": ("api_key",),
+    # Query strings carry the ids, fields and paging; a request with the wrong ones must
+    # not replay. Loosen this per test with @pytest.mark.vcr(match_on=...) only if needed.
+    "match_on": ("method", "scheme", "host", "port", "path", "query"),
+    "record_mode": "once",
+}
 
 
 @pytest.fixture(scope="session")
 def vcr_config() -> dict[str, object]:
-    cassette_dir = Path(__file__).parent / "cassettes"
-    return {
-        "cassette_library_dir": str(cassette_dir),
-        "path_transformer": vcr.VCR.ensure_suffix(".yaml"),
-        "filter_headers": ["user-agent", "x-api-key", "authorization"],
-        "filter_query_parameters": ["api_key"],
-        "match_on": ["method", "scheme", "host", "port", "path", "query"],
-        "record_mode": "once",
-    }
+    return _VCR_CONFIG
+
+
+@pytest.fixture(scope="session")
+def vcr_cassette_dir() -> str:
+    """All cassettes live in one flat directory rather than one per test module."""
+
+    return _CASSETTE_DIR
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """One CLI runner for the whole suite; each ``invoke`` isolates its own streams."""
+
+    return CliRunner()
+
+
+@pytest.fixture
+def frozen_datetime(monkeypatch: pytest.MonkeyPatch) -> type[datetime]:
+    """Stop the clock used for run timestamps in the CLI and full-text fetcher."""
+
+    monkeypatch.setattr("curate_ns_pond.cli.datetime", _FrozenDatetime)
+    monkeypatch.setattr("curate_ns_pond.fulltext.datetime", _FrozenDatetime)
+    return _FrozenDatetime
+
+
+@pytest.fixture
+def write_jsonl() -> Callable[[Path, list[dict[str, str | None]]], None]:
+    """Write ``records`` to ``path`` as JSON Lines input for the merge and fetch steps."""
+
+    return jsonl.write_jsonl
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import threading
+
+import httpx
+import pytest
+
+from curate_ns_pond.ratelimit import TokenBucket
+from curate_ns_pond.services.batching import chunked, fetch_chunks
+from curate_ns_pond.services.entrez import EntrezSummaryClient
+
+
+def test_chunked_splits_into_bounded_slices() -> None:
+    assert list(chunked(["a", "b", "c", "d", "e"], 2)) == [["a", "b"], ["c", "d"], ["e"]]
+    assert list(chunked([], 2)) == []
+    with pytest.raises(ValueError):
+        list(chunked(["a"], 0))
+
+
+def test_fetch_chunks_merges_in_chunk_order() -> None:
+    seen: list[list[int]] = []
+    lock = threading.Lock()
+
+    def fetch(chunk: list[int]) -> dict[int, int]:
+        with lock:
+            seen.append(chunk)
+        return {value % 3: value for value in chunk}
+
+    result = fetch_chunks(fetch, list(range(7)), 3)
+
+    assert sorted(seen) == [[0, 1, 2], [3, 4, 5], [6]]
+    # Later chunks overwrite earlier ones regardless of completion order.
+    assert result == {0: 6, 1: 4, 2: 5}
+
+
+def test_entrez_summaries_are_requested_in_chunks() -> None:
+    requested: list[list[str]] = []
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = request.url.params["id"].split(",")
+        with lock:
+            requested.append(ids)
+        result = {pmid: {"uid": pmid, "title": f"Paper {pmid}"} for pmid in ids}
+        return httpx.Response(200, json={"result": {"uids": ids, **result}})
+
+    client = EntrezSummaryClient(
+        _client=httpx.Client(transport=httpx.MockTransport(handler)),
+        rate_limiter=TokenBucket(rate=1000.0),
+    )
+    pmids = [str(value) for value in range(1, 451)]
+
+    metadata = client.fetch_metadata_batch(pmids)
+
+    assert list(metadata) == pmids
+    assert sorted(len(ids) for ids in requested) == [50, 200, 200]
+    client.close()
+
+
+def test_entrez_client_keeps_email_as_first_positional_field() -> None:
+    client = EntrezSummaryClient("me@example.org")
+
+    assert client.email == "me@example.org"
+    assert client.api_key is None
+    assert "api_key" not in client._base_params
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import os
 from pathlib import Path
+from typing import Callable
 
 import pytest
 from typer.testing import CliRunner
@@ -10,23 +10,15 @@ from typer.testing import CliRunner
 from curate_ns_pond.cli import app
 
 
-class _FixedDatetime(datetime):
-    @classmethod
-    def utcnow(cls) -> "_FixedDatetime":
-        return cls(2024, 1, 15, 12, 0, 0)
-
-
-def _write_jsonl(path: Path, records: list[dict[str, str | None]]) -> None:
-    with path.open("w", encoding="utf-8") as handle:
-        for record in records:
-            handle.write(json.dumps(record))
-            handle.write("\n")
-
-
+@pytest.mark.usefixtures("frozen_datetime")
 @pytest.mark.vcr
-def test_cli_fetch_fulltext(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_cli_fetch_fulltext(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    write_jsonl: Callable[..., None],
+    runner: CliRunner,
+) -> None:
     monkeypatch.setenv("CURATE_DATA_ROOT", str(tmp_path))
-    monkeypatch.setattr("curate_ns_pond.cli.datetime", _FixedDatetime)
 
     # PubGet requires an external CLI; return deterministic text to keep the test hermetic.
     monkeypatch.setattr(
@@ -41,7 +33,7 @@ def test_cli_fetch_fulltext(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) ->
     )
 
     input_file = tmp_path / "records.jsonl"
-    _write_jsonl(
+    write_jsonl(
         input_file,
         [
             {
@@ -52,12 +44,12 @@ def test_cli_fetch_fulltext(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) ->
         ],
     )
 
-    runner = CliRunner()
     result = runner.invoke(app, ["fetch", "fulltext", str(input_file)])
 
     assert result.exit_code == 0, result.stdout
     assert "Fetched full text for 1 of 1 records" in result.stdout
 
-    records_dir = tmp_path / "processed" / "fulltext"
-    json_files = list(records_dir.rglob("*.json"))
-    assert any(file.name.endswith(".json") for file in json_files)
+    with os.scandir(tmp_path / "processed" / "fulltext") as entries:
+        run_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+    assert len(run_dirs) == 1
+    assert len((run_dirs[0] / "records.jsonl").read_bytes().splitlines()) == 1
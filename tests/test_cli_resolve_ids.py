@@ -1,32 +1,30 @@
 from __future__ import annotations
 
-import json
-from datetime import datetime
 from pathlib import Path
 
 import pytest
 from typer.testing import CliRunner
 
 from curate_ns_pond.cli import app
+from curate_ns_pond.jsonl import loads
 from curate_ns_pond.resolution import normalize_identifier
 from curate_ns_pond.storage import hash_identifiers
 
 
-class _FixedDatetime(datetime):
-    @classmethod
-    def utcnow(cls) -> "_FixedDatetime":
-        return cls(2024, 1, 15, 12, 0, 0)
-
-
+# The cassette is partly synthetic: it was edited by hand, not re-recorded. The live PMC
+# ID converter answered the first request with 403 and the 200 came from a urllib retry
+# the client no longer makes; only the 301 redirect and that 200 were kept, and the
+# Semantic Scholar lookups the resolver no longer sends were removed.
+@pytest.mark.usefixtures("frozen_datetime")
 @pytest.mark.vcr
-def test_cli_resolve_ids_writes_outputs(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_cli_resolve_ids_writes_outputs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
+) -> None:
     monkeypatch.setenv("CURATE_DATA_ROOT", str(tmp_path))
-    monkeypatch.setattr("curate_ns_pond.cli.datetime", _FixedDatetime)
 
     input_path = tmp_path / "ids.txt"
     input_path.write_text("32256646\nPMC7086438\n")
 
-    runner = CliRunner()
     result = runner.invoke(app, ["resolve", "ids", str(input_path)])
 
     assert result.exit_code == 0, result.stdout
@@ -42,7 +40,7 @@ def test_cli_resolve_ids_writes_outputs(monkeypatch: pytest.MonkeyPatch, tmp_pat
     assert records_path.exists()
     assert metadata_path.exists()
 
-    records = [json.loads(line) for line in records_path.read_text().splitlines() if line]
+    records = [loads(line) for line in records_path.read_bytes().splitlines() if line]
     assert records == [
         {
             "pmid": "32256646",
@@ -51,8 +49,8 @@ def test_cli_resolve_ids_writes_outputs(monkeypatch: pytest.MonkeyPatch, tmp_pat
         }
     ]
 
-    metadata = json.loads(metadata_path.read_text())
+    metadata = loads(metadata_path.read_bytes())
     assert metadata["input_count"] == 2
     assert metadata["record_count"] == 1
-    assert metadata["sources"] == ["entrez", "pmc", "semantic-scholar"]
+    assert metadata["sources"] == ["entrez", "pmc"]
     assert metadata["input_hash"] == identifier_hash
@@ -1,28 +1,25 @@
 from __future__ import annotations
 
-import json
-from datetime import datetime
 from pathlib import Path
 
 import pytest
 from typer.testing import CliRunner
 
 from curate_ns_pond.cli import app
+from curate_ns_pond.jsonl import loads
 from curate_ns_pond.storage import hash_identifiers
 
 
-class _FixedDatetime(datetime):
-    @classmethod
-    def utcnow(cls) -> "_FixedDatetime":
-        return cls(2024, 1, 15, 12, 0, 0)
-
-
+# Synthetic fixture: the efetch interaction in this cassette was written by hand, not
+# recorded. Its WebEnv, headers and uilist body are made up, so this test checks the
+# client's request sequence, not the live esearch -> efetch history flow.
+@pytest.mark.usefixtures("frozen_datetime")
 @pytest.mark.vcr
-def test_search_pubmed_writes_pmids(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_search_pubmed_writes_pmids(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
+) -> None:
     monkeypatch.setenv("CURATE_DATA_ROOT", str(tmp_path))
-    monkeypatch.setattr("curate_ns_pond.cli.datetime", _FixedDatetime)
 
-    runner = CliRunner()
     result = runner.invoke(
         app,
         [
@@ -48,7 +45,7 @@ def test_search_pubmed_writes_pmids(monkeypatch: pytest.MonkeyPatch, tmp_path: P
     pmids = pmid_file.read_text().splitlines()
     assert set(pmids) == {"31452104", "31722068"}
 
-    metadata = json.loads(metadata_file.read_text())
+    metadata = loads(metadata_file.read_bytes())
     assert metadata["query"] == "31452104[pmid] OR 31722068[pmid]"
     assert metadata["result_count"] == 2
     assert metadata["run_started_at"].startswith("2024-01-15")
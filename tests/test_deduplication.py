@@ -1,26 +1,21 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
+from typing import Callable
 
 import pytest
 
 from curate_ns_pond.merge import MergeOutcome, merge_jsonl_files
 
 
-def _write_jsonl(path: Path, records: list[dict[str, str | None]]) -> None:
-    with path.open("w", encoding="utf-8") as handle:
-        for record in records:
-            handle.write(json.dumps(record))
-            handle.write("\n")
-
-
-def test_merge_jsonl_files_merges_overlapping_records(tmp_path: Path) -> None:
+def test_merge_jsonl_files_merges_overlapping_records(
+    tmp_path: Path, write_jsonl: Callable[..., None]
+) -> None:
     file_a = tmp_path / "a.jsonl"
     file_b = tmp_path / "b.jsonl"
 
-    _write_jsonl(file_a, [{"pmid": "123456", "doi": None, "pmcid": None}])
-    _write_jsonl(file_b, [{"pmid": "123456", "pmcid": "PMC123456", "doi": "10.1000/XYZ"}])
+    write_jsonl(file_a, [{"pmid": "123456", "doi": None, "pmcid": None}])
+    write_jsonl(file_b, [{"pmid": "123456", "pmcid": "PMC123456", "doi": "10.1000/XYZ"}])
 
     outcome_ab = merge_jsonl_files([file_a, file_b])
     outcome_ba = merge_jsonl_files([file_b, file_a])
@@ -37,9 +32,11 @@ def test_merge_jsonl_files_merges_overlapping_records(tmp_path: Path) -> None:
     assert not outcome_ab.errors
 
 
-def test_merge_jsonl_records_warn_on_conflicts(tmp_path: Path) -> None:
+def test_merge_jsonl_records_warn_on_conflicts(
+    tmp_path: Path, write_jsonl: Callable[..., None]
+) -> None:
     file_path = tmp_path / "conflict.jsonl"
-    _write_jsonl(
+    write_jsonl(
         file_path,
         [
             {"pmid": "123", "doi": "10.1/A"},
@@ -57,9 +54,11 @@ def test_merge_jsonl_records_warn_on_conflicts(tmp_path: Path) -> None:
     assert any("doi" in message for message in outcome.errors)
 
 
-def test_merge_jsonl_keeps_disconnected_records_separate(tmp_path: Path) -> None:
+def test_merge_jsonl_keeps_disconnected_records_separate(
+    tmp_path: Path, write_jsonl: Callable[..., None]
+) -> None:
     file_path = tmp_path / "disconnected.jsonl"
-    _write_jsonl(
+    write_jsonl(
         file_path,
         [
             {"pmid": "111"},
@@ -75,9 +74,11 @@ def test_merge_jsonl_keeps_disconnected_records_separate(tmp_path: Path) -> None
     assert (('doi', None), ('pmcid', 'PMC222'), ('pmid', None)) in values
 
 
-def test_merge_jsonl_skips_rows_without_identifiers(tmp_path: Path) -> None:
+def test_merge_jsonl_skips_rows_without_identifiers(
+    tmp_path: Path, write_jsonl: Callable[..., None]
+) -> None:
     file_path = tmp_path / "mixed.jsonl"
-    _write_jsonl(
+    write_jsonl(
         file_path,
         [
             {"pmid": "999"},
@@ -91,3 +92,19 @@ def test_merge_jsonl_skips_rows_without_identifiers(tmp_path: Path) -> None:
     assert len(outcome.records) == 2
     assert len(outcome.errors) == 1
     assert "no recognizable identifiers" in outcome.errors[0].lower()
+
+
+def test_merge_jsonl_handles_long_identifier_chains(
+    tmp_path: Path, write_jsonl: Callable[..., None]
+) -> None:
+    file_path = tmp_path / "chain.jsonl"
+    # Each row links one PMID to the DOI shared with the next row, forming a single long chain.
+    rows = [{"pmid": str(index), "doi": f"10.1/{index}"} for index in range(1, 3001)]
+    rows += [{"pmid": str(index + 1), "doi": f"10.1/{index}"} for index in range(1, 3000)]
+    write_jsonl(file_path, rows)
+
+    outcome = merge_jsonl_files([file_path])
+
+    assert len(outcome.records) == 1
+    assert outcome.records[0]["pmid"] == "1"
+    assert outcome.records[0]["doi"] == "10.1/1"
@@ -1,26 +1,37 @@
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import dbm
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable
 
 import pytest
 
+from curate_ns_pond import fulltext
 from curate_ns_pond.fulltext import ACEClient, FullTextFetcher, PubGetClient
+from curate_ns_pond.jsonl import loads
 from curate_ns_pond.settings import PipelineSettings
 
+_STARTED_AT = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
 
-class _FixedDatetime(datetime):
-    @classmethod
-    def utcnow(cls) -> "_FixedDatetime":
-        return cls(2024, 1, 15, 12, 0, 0)
 
+def _fixed_now() -> datetime:
+    return _STARTED_AT
 
-def _write_jsonl(path: Path, records: list[dict[str, str | None]]) -> None:
-    with path.open("w", encoding="utf-8") as handle:
-        for record in records:
-            handle.write(json.dumps(record))
-            handle.write("\n")
+
+@pytest.fixture(scope="module")
+def settings(tmp_path_factory: pytest.TempPathFactory) -> PipelineSettings:
+    """One data root for the module; each batch writes under its own hashed run directory."""
+
+    return PipelineSettings(data_root=tmp_path_factory.mktemp("fulltext"))
+
+
+class _CountingLimiter:
+    def __init__(self) -> None:
+        self.acquired = 0
+
+    def acquire(self) -> None:
+        self.acquired += 1
 
 
 def _skip_if_ace_missing() -> None:
@@ -31,10 +42,12 @@ def _skip_if_ace_missing() -> None:
 
 
 @pytest.mark.vcr
-def test_fulltext_fetcher_prefers_pubget(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    monkeypatch.setenv("CURATE_DATA_ROOT", str(tmp_path))
-    monkeypatch.setattr("curate_ns_pond.fulltext.datetime", _FixedDatetime)
-
+def test_fulltext_fetcher_prefers_pubget(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    settings: PipelineSettings,
+    write_jsonl: Callable[..., None],
+) -> None:
     # Ensure the pubget CLI returns deterministic content without invoking the network.
     monkeypatch.setattr(
         PubGetClient,
@@ -43,7 +56,7 @@ def test_fulltext_fetcher_prefers_pubget(monkeypatch: pytest.MonkeyPatch, tmp_pa
     )
 
     input_file = tmp_path / "records.jsonl"
-    _write_jsonl(
+    write_jsonl(
         input_file,
         [
             {
@@ -54,7 +67,7 @@ def test_fulltext_fetcher_prefers_pubget(monkeypatch: pytest.MonkeyPatch, tmp_pa
         ],
     )
 
-    fetcher = FullTextFetcher(settings=PipelineSettings())
+    fetcher = FullTextFetcher(settings=settings, now=_fixed_now)
 
     try:
         result = fetcher.fetch_from_files([input_file])
@@ -67,27 +80,36 @@ def test_fulltext_fetcher_prefers_pubget(monkeypatch: pytest.MonkeyPatch, tmp_pa
     assert result.sources_used == {"pubget"}
     assert "entrez" in result.metadata_sources_used
 
-    run_dir = tmp_path / "processed" / "fulltext" / result.batch_hash
-    payload = json.loads(next((run_dir / "records").glob("*.json")).read_text())
+    run_dir = settings.processed_dir / "fulltext" / result.batch_hash
+    payload = loads((run_dir / "records.jsonl").read_bytes().splitlines()[0])
     assert payload["text_source"] == "pubget"
     assert payload["text"] == "pubget text"
     assert "Nano Leo" in (payload["metadata"]["title"] or "")
     assert payload["metadata"]["source"] in {"semantic-scholar", "entrez"}
 
+    metadata = loads((run_dir / "metadata.json").read_bytes())
+    assert metadata["run_started_at"] == "2024-01-15T12:00:00Z"
+
 
 @pytest.mark.vcr
-def test_fulltext_fetcher_falls_back_to_ace(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_fulltext_fetcher_falls_back_to_ace(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    settings: PipelineSettings,
+    write_jsonl: Callable[..., None],
+) -> None:
     _skip_if_ace_missing()
 
-    monkeypatch.setenv("CURATE_DATA_ROOT", str(tmp_path))
-    monkeypatch.setattr("curate_ns_pond.fulltext.datetime", _FixedDatetime)
-
     # Force PubGet failure so the fetcher uses ACE as a fallback path.
     monkeypatch.setattr(PubGetClient, "fetch_text", lambda self, pmcid: None)
-    monkeypatch.setattr(ACEClient, "fetch_text", lambda self, pmid: "ace text" if pmid == "31452104" else None)
+    monkeypatch.setattr(
+        ACEClient,
+        "fetch_html",
+        lambda self, pmid: "<p>ace text</p>" if pmid == "31452104" else None,
+    )
 
     input_file = tmp_path / "records.jsonl"
-    _write_jsonl(
+    write_jsonl(
         input_file,
         [
             {
@@ -98,7 +120,7 @@ def test_fulltext_fetcher_falls_back_to_ace(monkeypatch: pytest.MonkeyPatch, tmp
         ],
     )
 
-    fetcher = FullTextFetcher(settings=PipelineSettings())
+    fetcher = FullTextFetcher(settings=settings, now=_fixed_now)
 
     try:
         result = fetcher.fetch_from_files([input_file])
@@ -110,8 +132,8 @@ def test_fulltext_fetcher_falls_back_to_ace(monkeypatch: pytest.MonkeyPatch, tmp
     assert result.sources_used == {"ace"}
     assert "semantic-scholar" in result.metadata_sources_used
 
-    run_dir = tmp_path / "processed" / "fulltext" / result.batch_hash
-    payload = json.loads(next((run_dir / "records").glob("*.json")).read_text())
+    run_dir = settings.processed_dir / "fulltext" / result.batch_hash
+    payload = loads((run_dir / "records.jsonl").read_bytes().splitlines()[0])
     assert payload["text_source"] == "ace"
     assert payload["text"] == "ace text"
     assert "Molegro Virtual Docker" in (payload["metadata"]["title"] or "")
@@ -119,18 +141,20 @@ def test_fulltext_fetcher_falls_back_to_ace(monkeypatch: pytest.MonkeyPatch, tmp
 
 
 @pytest.mark.vcr
-def test_fulltext_fetcher_records_failure(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    monkeypatch.setenv("CURATE_DATA_ROOT", str(tmp_path))
-    monkeypatch.setattr("curate_ns_pond.fulltext.datetime", _FixedDatetime)
-
+def test_fulltext_fetcher_records_failure(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    settings: PipelineSettings,
+    write_jsonl: Callable[..., None],
+) -> None:
     # Simulate missing full text across all providers.
     monkeypatch.setattr(PubGetClient, "fetch_text", lambda self, pmcid: None)
-    monkeypatch.setattr(ACEClient, "fetch_text", lambda self, pmid: None)
+    monkeypatch.setattr(ACEClient, "fetch_html", lambda self, pmid: None)
 
     input_file = tmp_path / "records.jsonl"
-    _write_jsonl(input_file, [{"pmid": "999999999", "pmcid": None, "doi": None}])
+    write_jsonl(input_file, [{"pmid": "999999999", "pmcid": None, "doi": None}])
 
-    fetcher = FullTextFetcher(settings=PipelineSettings())
+    fetcher = FullTextFetcher(settings=settings, now=_fixed_now)
 
     try:
         result = fetcher.fetch_from_files([input_file])
@@ -143,7 +167,248 @@ def test_fulltext_fetcher_records_failure(monkeypatch: pytest.MonkeyPatch, tmp_p
     assert "999999999" in " ".join(result.errors)
     assert not result.metadata_sources_used
 
-    run_dir = tmp_path / "processed" / "fulltext" / result.batch_hash
-    payload = json.loads(next((run_dir / "records").glob("*.json")).read_text())
+    run_dir = settings.processed_dir / "fulltext" / result.batch_hash
+    payload = loads((run_dir / "records.jsonl").read_bytes().splitlines()[0])
     assert payload["text"] is None
     assert payload["metadata"] is None
+
+
+class _DummyMetadataClient:
+    def fetch_metadata_batch(self, identifiers: list[str]) -> dict[str, dict[str, object]]:
+        return {}
+
+
+def test_fulltext_fetcher_concurrent_fetch_preserves_order(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    settings: PipelineSettings,
+    write_jsonl: Callable[..., None],
+) -> None:
+    monkeypatch.setattr(
+        PubGetClient, "fetch_text", lambda self, pmcid: None if pmcid == "PMC3" else f"text {pmcid}"
+    )
+
+    input_file = tmp_path / "records.jsonl"
+    write_jsonl(
+        input_file,
+        [{"pmid": None, "pmcid": f"PMC{index}", "doi": None} for index in range(1, 6)],
+    )
+
+    fetcher = FullTextFetcher(
+        settings=settings,
+        ace_client=object(),  # type: ignore[arg-type]
+        semantic_client=_DummyMetadataClient(),  # type: ignore[arg-type]
+        entrez_client=_DummyMetadataClient(),  # type: ignore[arg-type]
+        concurrency=2,
+        now=_fixed_now,
+    )
+    result = fetcher.fetch_from_files([input_file])
+
+    assert [record.pmcid for record in result.records] == [f"PMC{index}" for index in range(1, 6)]
+    assert [record.text for record in result.records] == [
+        "text PMC1",
+        "text PMC2",
+        None,
+        "text PMC4",
+        "text PMC5",
+    ]
+    assert result.errors == ["PubGet returned no text for PMC3"]
+
+
+@pytest.mark.parametrize("use_selectolax", [True, False])
+def test_ace_clean_html_extracts_visible_text(
+    monkeypatch: pytest.MonkeyPatch, use_selectolax: bool
+) -> None:
+    if use_selectolax:
+        pytest.importorskip("selectolax.lexbor")
+    else:
+        monkeypatch.setattr("curate_ns_pond.fulltext.LexborHTMLParser", None)
+
+    html = (
+        "<html><head><title>Title</title><style>p {color: red}</style></head>"
+        "<body><p>  First  paragraph </p>\n\n<script>var x = 1;</script><div>Second</div></body></html>"
+    )
+
+    assert fulltext._clean_html(html) == "Title\nFirst  paragraph\nSecond"
+
+
+def test_clean_html_batch_uses_process_pool_for_large_batches() -> None:
+    htmls = [f"<p>doc {index}</p><p></p>" for index in range(fulltext._PROCESS_POOL_THRESHOLD)]
+
+    assert fulltext._clean_html_batch(htmls) == [f"doc {index}" for index in range(len(htmls))]
+    # Never fork: the pool is started while other threads may hold locks.
+    assert fulltext._PROCESS_POOL_CONTEXT.get_start_method() in {"forkserver", "spawn"}
+
+
+def test_pubget_client_runs_pubget_in_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[int]] = []
+
+    class _FakePubget:
+        @staticmethod
+        def download_pmcids(pmcids, data_dir, *, api_key=None):
+            calls.append(list(pmcids))
+            return Path(data_dir) / "articlesets", 0
+
+        @staticmethod
+        def extract_articles(articlesets_dir):
+            return articlesets_dir.parent / "articles", 0
+
+        @staticmethod
+        def extract_data_to_csv(articles_dir):
+            output = articles_dir.parent / "extracted"
+            output.mkdir()
+            (output / "text.csv").write_text(
+                "pmcid,title,keywords,abstract,body\n12345,Title,,Abstract,  Body text \n",
+                encoding="utf-8",
+            )
+            return output, 0
+
+    monkeypatch.setattr(PubGetClient, "_load_pubget_module", staticmethod(lambda: _FakePubget))
+    monkeypatch.setattr(
+        "curate_ns_pond.fulltext.subprocess.run",
+        lambda *args, **kwargs: pytest.fail("pubget should not be invoked as a subprocess"),
+    )
+
+    limiter = _CountingLimiter()
+    assert PubGetClient(rate_limiter=limiter).fetch_text("PMC12345") == "Body text"
+    assert calls == [[12345]]
+    assert limiter.acquired == 1
+
+
+def test_metadata_builders_follow_source_schemas() -> None:
+    semantic = FullTextFetcher._metadata_from_semantic(
+        {
+            "title": "Title",
+            "abstract": None,
+            "authors": ["A. Author"],
+            "journal": {"name": "Journal of Tests", "volume": "1"},
+            "venue": "Venue",
+            "year": 2020,
+        }
+    )
+    assert semantic.journal == "Journal of Tests"
+    assert semantic.year == 2020
+    assert semantic.source == "semantic-scholar"
+
+    entrez = FullTextFetcher._metadata_from_entrez(
+        {"title": "Title", "authors": ["B. Author"], "journal": "Journal", "year": "2019 Mar 4"}
+    )
+    assert entrez.authors == ["B. Author"]
+    assert entrez.year == 2019
+    assert entrez.source == "entrez"
+
+
+def test_ace_client_caches_journal_lookups(tmp_path: Path) -> None:
+    _skip_if_ace_missing()
+    lookups: list[str] = []
+    journals: list[str] = []
+
+    def metadata_fetcher(pmid: str) -> dict[str, str]:
+        lookups.append(pmid)
+        return {"journal": "NeuroImage"}
+
+    class _Scraper:
+        def get_html_by_pmid(self, pmid: str, *, journal: str, **kwargs: object) -> str:
+            journals.append(journal)
+            return "<p>body</p>"
+
+    limiter = _CountingLimiter()
+    for _ in range(2):
+        client = ACEClient(
+            scraper=_Scraper(),
+            metadata_fetcher=metadata_fetcher,
+            metadata_cache_dir=tmp_path / "ace_metadata",
+            rate_limiter=limiter,
+        )
+        assert client.fetch_text("123") == "body"
+        client.close()
+
+    # Only the uncached lookup spends an NCBI request token.
+    assert lookups == ["123"]
+    assert limiter.acquired == 1
+    assert journals == ["NeuroImage", "NeuroImage"]
+
+
+def test_ace_client_creates_journal_cache_on_first_write(tmp_path: Path) -> None:
+    _skip_if_ace_missing()
+    cache_dir = tmp_path / "ace_metadata"
+    client = ACEClient(
+        scraper=object(),
+        metadata_fetcher=lambda pmid: {"journal": "NeuroImage"},
+        metadata_cache_dir=cache_dir,
+    )
+
+    assert client._cached_journal("123") is None
+    assert not cache_dir.exists()
+
+    assert client._lookup_journal("123") == "NeuroImage"
+    assert cache_dir.is_dir()
+    client.close()
+
+
+def test_ace_client_runs_uncached_when_journal_cache_is_locked(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _skip_if_ace_missing()
+    lookups: list[str] = []
+
+    def locked(*args: object, **kwargs: object) -> None:
+        raise dbm.error[0]("Resource temporarily unavailable")
+
+    def metadata_fetcher(pmid: str) -> dict[str, str]:
+        lookups.append(pmid)
+        return {"journal": "NeuroImage"}
+
+    monkeypatch.setattr(fulltext.shelve, "open", locked)
+    client = ACEClient(
+        scraper=object(),
+        metadata_fetcher=metadata_fetcher,
+        metadata_cache_dir=tmp_path / "ace_metadata",
+        rate_limiter=_CountingLimiter(),
+    )
+
+    with pytest.warns(RuntimeWarning, match="journal cache unavailable"):
+        assert client._lookup_journal("123") == "NeuroImage"
+    assert client._lookup_journal("123") == "NeuroImage"
+    assert lookups == ["123", "123"]
+    client.close()
+
+
+@pytest.mark.parametrize("use_xxhash", [True, False])
+def test_load_records_drops_duplicates(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    settings: PipelineSettings,
+    use_xxhash: bool,
+    write_jsonl: Callable[..., None],
+) -> None:
+    if use_xxhash:
+        pytest.importorskip("xxhash")
+    else:
+        monkeypatch.setattr("curate_ns_pond.fulltext.xxhash", None)
+    input_file = tmp_path / "records.jsonl"
+    write_jsonl(
+        input_file,
+        [
+            {"pmid": "1", "pmcid": None, "doi": None},
+            {"pmid": "1", "pmcid": None, "doi": None},
+            {"pmid": "1", "pmcid": "PMC1", "doi": None},
+            {"pmid": "None", "pmcid": None, "doi": None},
+        ],
+    )
+
+    fetcher = FullTextFetcher(
+        settings=settings,
+        pubget_client=object(),  # type: ignore[arg-type]
+        ace_client=object(),  # type: ignore[arg-type]
+        semantic_client=_DummyMetadataClient(),  # type: ignore[arg-type]
+        entrez_client=_DummyMetadataClient(),  # type: ignore[arg-type]
+    )
+    errors: list[str] = []
+
+    assert fetcher._load_records([input_file], errors) == [
+        {"pmid": "1", "pmcid": None, "doi": None},
+        {"pmid": "1", "pmcid": "PMC1", "doi": None},
+        {"pmid": "None", "pmcid": None, "doi": None},
+    ]
+    assert not errors
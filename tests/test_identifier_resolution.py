@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import threading
+from datetime import timezone
+
 import pytest
 
 from curate_ns_pond.resolution import (
@@ -7,6 +10,7 @@ from curate_ns_pond.resolution import (
     IdentifierKind,
     NormalizedIdentifier,
     ResolutionResult,
+    _ResolutionState,
     normalize_identifier,
 )
 from curate_ns_pond.services.entrez import EntrezError, EntrezSummaryClient
@@ -40,7 +44,14 @@ def test_normalize_identifier_variants() -> None:
     with pytest.raises(ValueError):
         normalize_identifier("not an id")
 
+    # Normalization is memoized; repeated inputs return the same frozen instance.
+    assert normalize_identifier("10.1000/ABC") is doi
+
 
+# The cassette is partly synthetic: it was edited by hand, not re-recorded. The live PMC
+# ID converter answered the first request with 403 and the 200 came from a urllib retry
+# the client no longer makes; only the 301 redirect and that 200 were kept, and the
+# Semantic Scholar lookups the resolver no longer sends were removed.
 @pytest.mark.vcr
 def test_resolver_merges_sources() -> None:
     with IdentifierResolver() as resolver:
@@ -57,32 +68,31 @@ def test_resolver_merges_sources() -> None:
     assert record.pmid == "32256646"
     assert record.pmcid == "PMC7086438"
     assert record.doi == "10.1155/2020/4598217"
-    assert result.sources_used == {"semantic-scholar", "pmc", "entrez"}
+    # PMC and Entrez resolve every identifier, so Semantic Scholar is never asked.
+    assert result.sources_used == {"pmc", "entrez"}
     assert result.errors == []
+    assert result.started_at.tzinfo is timezone.utc
 
 
 @pytest.mark.vcr
 def test_resolver_records_errors() -> None:
     class ErrorSemanticScholarClient(SemanticScholarClient):
-        def fetch_external_ids(self, identifier: str) -> dict[str, str] | None:
-            assert self._client is not None
-            response = self._client.get("https://httpbin.org/status/500")
+        def fetch_external_ids_batch(self, identifiers, chunk=500):  # type: ignore[override]
+            response = self.client.get("https://httpbin.org/status/500")
             if response.status_code >= 400:
                 raise SemanticScholarError("semantic-scholar: forced failure")
-            return None
+            return {}
 
     class ErrorEntrezClient(EntrezSummaryClient):
         def fetch_article_ids(self, pmids):  # type: ignore[override]
-            assert self._client is not None
-            response = self._client.get("https://httpbin.org/status/500")
+            response = self.client.get("https://httpbin.org/status/500")
             if response.status_code >= 400:
                 raise EntrezError("entrez: forced failure")
             return {}
 
     class ErrorPMCConverter(PMCIdConverter):
         def convert(self, pmcids):  # type: ignore[override]
-            assert self._client is not None
-            response = self._client.get("https://httpbin.org/status/500")
+            response = self.client.get("https://httpbin.org/status/500")
             if response.status_code >= 400:
                 raise PMCError("pmc: forced failure")
             return {}
@@ -115,3 +125,122 @@ def test_resolver_records_errors() -> None:
     assert "semantic-scholar" in " ".join(result.errors)
     assert "pmc" in " ".join(result.errors)
     assert "entrez" in " ".join(result.errors)
+
+
+def test_resolver_queries_pmc_and_entrez_concurrently() -> None:
+    # Each fake waits for the other, so a sequential resolver would time out.
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _PMC:
+        def convert(self, pmcids):
+            barrier.wait()
+            return {"PMC7086438": {"pmid": "32256646"}}
+
+    class _Entrez:
+        def fetch_article_ids(self, pmids):
+            barrier.wait()
+            return {"32256646": {"doi": "10.1155/2020/4598217"}}
+
+    class _Semantic:
+        def fetch_external_ids_batch(self, identifiers):
+            return {}
+
+    resolver = IdentifierResolver(
+        semantic_scholar=_Semantic(),  # type: ignore[arg-type]
+        entrez=_Entrez(),  # type: ignore[arg-type]
+        pmc_converter=_PMC(),  # type: ignore[arg-type]
+    )
+    result = resolver.resolve(
+        [normalize_identifier("32256646"), normalize_identifier("PMC7086438")]
+    )
+
+    assert [record.to_dict() for record in result.records] == [
+        {"pmid": "32256646", "pmcid": "PMC7086438", "doi": "10.1155/2020/4598217"}
+    ]
+    assert result.sources_used == {"pmc", "entrez"}
+
+
+def test_resolver_sends_pmids_found_by_pmc_to_entrez() -> None:
+    entrez_calls: list[list[str]] = []
+
+    class _PMC:
+        def convert(self, pmcids):
+            return {"PMC7086438": {"pmid": "32256646"}}
+
+    class _Entrez:
+        def fetch_article_ids(self, pmids):
+            entrez_calls.append(list(pmids))
+            return {"32256646": {"doi": "10.1155/2020/4598217"}}
+
+    class _Semantic:
+        def fetch_external_ids_batch(self, identifiers):
+            return {}
+
+    resolver = IdentifierResolver(
+        semantic_scholar=_Semantic(),  # type: ignore[arg-type]
+        entrez=_Entrez(),  # type: ignore[arg-type]
+        pmc_converter=_PMC(),  # type: ignore[arg-type]
+    )
+    result = resolver.resolve([normalize_identifier("PMC7086438")])
+
+    # The PMCID-only input has no PMID for the first round, so Entrez is asked afterwards.
+    assert entrez_calls == [["32256646"]]
+    assert [record.to_dict() for record in result.records] == [
+        {"pmid": "32256646", "pmcid": "PMC7086438", "doi": "10.1155/2020/4598217"}
+    ]
+    assert result.sources_used == {"pmc", "entrez"}
+
+
+def test_resolver_probes_semantic_scholar_once_per_incomplete_record() -> None:
+    probes: list[list[str]] = []
+
+    class _PMC:
+        def convert(self, pmcids):
+            return {"PMC1": {"pmid": "1", "doi": "10.1/one"}}
+
+    class _Entrez:
+        def fetch_article_ids(self, pmids):
+            return {"2": {"doi": "10.1/two"}}
+
+    class _Semantic:
+        def fetch_external_ids_batch(self, identifiers):
+            probes.append(list(identifiers))
+            return {"DOI:10.1/two": {"pmcid": "PMC2"}}
+
+    resolver = IdentifierResolver(
+        semantic_scholar=_Semantic(),  # type: ignore[arg-type]
+        entrez=_Entrez(),  # type: ignore[arg-type]
+        pmc_converter=_PMC(),  # type: ignore[arg-type]
+    )
+    result = resolver.resolve(
+        [
+            normalize_identifier("PMC1"),
+            normalize_identifier("2"),
+            normalize_identifier("3"),
+        ]
+    )
+
+    assert probes == [["DOI:10.1/two", "PMID:3"]]
+    assert [record.to_dict() for record in result.records] == [
+        {"pmid": "1", "pmcid": "PMC1", "doi": "10.1/one"},
+        {"pmid": "2", "pmcid": "PMC2", "doi": "10.1/two"},
+        {"pmid": "3", "pmcid": None, "doi": None},
+    ]
+    assert result.sources_used == {"pmc", "entrez", "semantic-scholar"}
+
+
+def test_resolution_state_merges_into_existing_record() -> None:
+    state = _ResolutionState()
+    first = state.ensure_record(IdentifierKind.PMID, "1")
+    second = state.ensure_record(IdentifierKind.PMCID, "PMC2")
+    third = state.ensure_record(IdentifierKind.DOI, "10.1/three")
+
+    # Linking the DOI record to the PMCID folds it into the earlier PMCID record.
+    merged = state.link(third, IdentifierKind.PMCID, "PMC2")
+    merged = state.link(merged, IdentifierKind.PMID, "1")
+
+    assert state.find(second) == state.find(third) == state.find(first) == merged
+    assert [record.to_dict() for record in state.records] == [
+        {"pmid": "1", "pmcid": "PMC2", "doi": "10.1/three"}
+    ]
+    assert state.ensure_record(IdentifierKind.DOI, "10.1/THREE") == merged
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+
+from curate_ns_pond.jsonl import iter_jsonl, write_jsonl
+from curate_ns_pond.resolution import ResolvedRecord
+from curate_ns_pond.storage import combine_file_digests, hash_file_contents, new_content_hasher
+
+
+def test_iter_jsonl_skips_blank_lines_and_records_errors(tmp_path: Path) -> None:
+    path = tmp_path / "records.jsonl"
+    path.write_bytes(b'{"pmid": "1"}\n\n  \n{not json}\n[1, 2]\n{"doi": "10.1/x"}')
+
+    errors: list[str] = []
+    records = list(iter_jsonl(path, errors))
+
+    assert records == [(1, {"pmid": "1"}), (6, {"doi": "10.1/x"})]
+    assert len(errors) == 2
+    assert errors[0].startswith(f"{path}:4: invalid JSON")
+    assert errors[1] == f"{path}:5: expected JSON object per line"
+
+
+def test_iter_jsonl_splits_crlf_and_cr(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    # A tiny buffer splits the \r\n pairs across read boundaries.
+    monkeypatch.setattr("curate_ns_pond.jsonl._READ_BUFFER_SIZE", 14)
+    path = tmp_path / "records.jsonl"
+    path.write_bytes(b'{"pmid": "1"}\r\n\r\n{"pmid": "2"}\r{"doi": "10.1/x"}\r\n')
+
+    errors: list[str] = []
+    records = list(iter_jsonl(path, errors))
+
+    assert records == [(1, {"pmid": "1"}), (3, {"pmid": "2"}), (4, {"doi": "10.1/x"})]
+    assert not errors
+
+
+def test_write_jsonl_round_trips(tmp_path: Path) -> None:
+    path = tmp_path / "out.jsonl"
+    records = [
+        {"pmid": "1", "pmcid": None, "doi": None},
+        {"pmid": None, "pmcid": "PMC2", "doi": "10.1/y"},
+    ]
+
+    write_jsonl(path, records)
+
+    errors: list[str] = []
+    assert [record for _, record in iter_jsonl(path, errors)] == records
+    assert not errors
+
+
+def test_write_jsonl_serializes_dataclasses(tmp_path: Path) -> None:
+    path = tmp_path / "out.jsonl"
+
+    write_jsonl(path, [ResolvedRecord(pmid="1"), ResolvedRecord(pmcid="PMC2", doi="10.1/y")])
+
+    assert path.read_text().splitlines() == [
+        '{"pmid":"1","pmcid":null,"doi":null}',
+        '{"pmid":null,"pmcid":"PMC2","doi":"10.1/y"}',
+    ]
+    assert path.read_bytes().count(b"\n") == 2
+
+
+def test_iter_jsonl_hashes_while_reading(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    # A tiny buffer forces lines to straddle read boundaries.
+    monkeypatch.setattr("curate_ns_pond.jsonl._READ_BUFFER_SIZE", 7)
+    first = tmp_path / "a.jsonl"
+    second = tmp_path / "b.jsonl"
+    first.write_bytes(b'{"pmid": "1"}\n{"pmid": "2"}\n')
+    second.write_bytes(b'{"doi": "10.1/x"}')
+
+    errors: list[str] = []
+    records = []
+    digests = []
+    for path in (first, second):
+        hasher = new_content_hasher()
+        records.extend(record for _, record in iter_jsonl(path, errors, hasher))
+        digests.append(hasher.hexdigest())
+
+    assert records == [{"pmid": "1"}, {"pmid": "2"}, {"doi": "10.1/x"}]
+    assert combine_file_digests(digests) == hash_file_contents([second, first])
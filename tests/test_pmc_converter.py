@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from curate_ns_pond.services import transport
+from curate_ns_pond.services.pmc import PMCError, PMCIdConverter
+
+
+def test_convert_raises_with_email_hint_on_403() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(403, text="Forbidden")
+
+    converter = PMCIdConverter(_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    with pytest.raises(PMCError, match="pass an email"):
+        converter.convert(["PMC7086438"])
+    converter.close()
+
+
+def test_client_identifies_itself_with_user_agent(monkeypatch: pytest.MonkeyPatch) -> None:
+    user_agents: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        user_agents.append(request.headers["user-agent"])
+        return httpx.Response(200, json={"records": [{"pmcid": "PMC1", "pmid": "1"}]})
+
+    monkeypatch.setattr(transport, "_POOL", httpx.MockTransport(handler))
+    converter = PMCIdConverter(email="curator@example.org")
+
+    assert converter.convert(["PMC1"]) == {"PMC1": {"pmid": "1"}}
+    assert user_agents == ["CurateNSPond/1.0 (curator@example.org)"]
+    converter.close()
@@ -1,24 +1,48 @@
 from __future__ import annotations
 
+from typing import Iterator
+
 import pytest
 
 from curate_ns_pond.services.pubmed import PubMedError, PubMedSearchService
+from curate_ns_pond.services.transport import build_client
+
+
+@pytest.fixture(scope="module")
+def service() -> Iterator[PubMedSearchService]:
+    """One search service, and one HTTP client, for every test in the module."""
+
+    client = build_client(timeout=30.0)
+    yield PubMedSearchService(retmax=1, _client=client)
+    client.close()
 
 
+# Synthetic fixture: the efetch interaction in this cassette was written by hand, not
+# recorded. Its WebEnv, headers and uilist body are made up, so this test checks the
+# client's request sequence, not the live esearch -> efetch history flow.
 @pytest.mark.vcr
-def test_service_fetches_multiple_pages(vcr) -> None:
-    service = PubMedSearchService(retmax=1)
+def test_service_fetches_multiple_pages(vcr, service: PubMedSearchService) -> None:
     results = service.search_pmids("31452104[pmid] OR 31722068[pmid]")
 
     assert len(results) == 2
     assert set(results) == {"31722068", "31452104"}
     assert len(vcr.requests) == 2
+    search, fetch = (dict(request.query) for request in vcr.requests)
+    assert search["retmax"] == "1"
+    assert search["usehistory"] == "y"
+    # The first page came back with the search; the rest is fetched from the history server.
+    assert fetch["retstart"] == "1"
+    assert fetch["query_key"] == "1"
+    assert fetch["WebEnv"].startswith("MCID_")
 
 
 @pytest.mark.vcr
-def test_service_raises_for_http_error() -> None:
-    service = PubMedSearchService(retmax=1)
-    service.BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/invalid.fcgi"
+def test_service_raises_for_http_error(
+    monkeypatch: pytest.MonkeyPatch, service: PubMedSearchService
+) -> None:
+    monkeypatch.setattr(
+        service, "BASE_URL", "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/invalid.fcgi"
+    )
 
     with pytest.raises(PubMedError):
         service.search_pmids("brain imaging")
@@ -0,0 +1,41 @@
+import time
+
+import pytest
+
+from curate_ns_pond.ratelimit import TokenBucket, ncbi_rate, shared_bucket
+
+
+def test_token_bucket_allows_burst_then_throttles() -> None:
+    bucket = TokenBucket(rate=20.0, capacity=2)
+
+    start = time.monotonic()
+    for _ in range(4):
+        with bucket:
+            pass
+    elapsed = time.monotonic() - start
+
+    # Two tokens are available immediately; the remaining two refill at 20/s.
+    assert elapsed >= 0.09
+
+
+def test_token_bucket_rejects_invalid_rate() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_shared_bucket_is_reused_per_host() -> None:
+    first = shared_bucket("reused.example.org", ncbi_rate(None))
+    second = shared_bucket("reused.example.org", ncbi_rate(None))
+
+    assert first is second
+    assert first.rate == 3.0
+
+
+def test_shared_bucket_keeps_the_lowest_rate_per_host() -> None:
+    keyed = shared_bucket("lowest.example.org", ncbi_rate("key"))
+    anonymous = shared_bucket("lowest.example.org", ncbi_rate(None))
+
+    assert keyed is anonymous
+    assert keyed.rate == 3.0
+    assert keyed.capacity == 3.0
+    assert shared_bucket("lowest.example.org", ncbi_rate("key")).rate == 3.0
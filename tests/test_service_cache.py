@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+
+from curate_ns_pond.services.cache import LRUCache
+from curate_ns_pond.services.semantic_scholar import SemanticScholarClient
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, int | None] = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", None)
+    assert cache.get_many(["a"]) == {"a": 1}
+
+    cache.put("c", 3)
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+    assert len(cache) == 2
+
+
+def test_semantic_scholar_batch_only_requests_unseen_ids() -> None:
+    posted: list[list[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = json.loads(request.content)["ids"]
+        posted.append(ids)
+        papers = [
+            {"externalIds": {"DOI": "10.1/x"}} if value == "PMID:1" else None for value in ids
+        ]
+        return httpx.Response(200, json=papers)
+
+    client = SemanticScholarClient(_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    first = client.fetch_external_ids_batch(["PMID:1", "PMID:2"])
+    second = client.fetch_external_ids_batch(["PMID:2", "PMID:1", "DOI:10.1/x"])
+
+    assert first == {"PMID:1": {"doi": "10.1/x"}}
+    assert second == first
+    assert posted == [["PMID:1", "PMID:2"], ["DOI:10.1/x"]]
+    client.close()
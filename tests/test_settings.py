@@ -22,3 +22,11 @@ def test_environment_override(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -
 
     assert settings.data_root == tmp_path
     assert settings.raw_dir == tmp_path / "raw"
+
+
+def test_keyword_override_takes_precedence(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("CURATE_DATA_ROOT", str(tmp_path / "env"))
+    settings = PipelineSettings(data_root=tmp_path)
+
+    assert settings.data_root == tmp_path
+    assert settings.processed_dir == tmp_path / "processed"
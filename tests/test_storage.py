@@ -1,21 +1,36 @@
+import io
 from pathlib import Path
 
 import pytest
 
 from curate_ns_pond.storage import (
+    _hash_normalized,
     build_hashed_output_dir,
     hash_file_contents,
     hash_identifiers,
+    hash_stream_contents,
 )
 
+# Output directory names are derived from these hashes, so the values are pinned.
+_IDENTIFIERS = ("pmid:123", "doi:10.1000/xyz")
+_IDENTIFIERS_HASH = "e4860e907230d8b7"
+_HELLO_WORLD_FILES_HASH = "408227476134d489"
+
 
 def test_hash_identifiers_is_stable() -> None:
-    identifiers = ["pmid:123", "doi:10.1000/xyz"]
-    first = hash_identifiers(identifiers)
-    second = hash_identifiers(list(reversed(identifiers)))
+    before = _hash_normalized.cache_info()
+    first = hash_identifiers(list(_IDENTIFIERS))
+    second = hash_identifiers(list(reversed(_IDENTIFIERS)))
+
+    assert first == second == _IDENTIFIERS_HASH
+    # Both orders normalize to the same sorted batch, so the second call is a memo hit.
+    assert _hash_normalized.cache_info().hits > before.hits
+
 
-    assert first == second
-    assert len(first) == 16
+def test_hash_identifiers_single_identifier_matches_general_path() -> None:
+    assert hash_identifiers(["  neuroimaging "]) == hash_identifiers(iter(["neuroimaging", " "]))
+    with pytest.raises(ValueError):
+        hash_identifiers(["   "])
 
 
 def test_build_hashed_output_dir_creates_nested_dir(tmp_path: Path) -> None:
@@ -33,11 +48,31 @@ def test_build_hashed_output_dir_raises_on_empty_list(tmp_path: Path) -> None:
 def test_hash_file_contents_stable(tmp_path: Path) -> None:
     file_a = tmp_path / "a.jsonl"
     file_b = tmp_path / "b.jsonl"
-    file_a.write_text("hello\n")
-    file_b.write_text("world\n")
+    file_a.write_bytes(b"hello\n")
+    file_b.write_bytes(b"world\n")
 
     first = hash_file_contents([file_a, file_b])
     second = hash_file_contents([file_b, file_a])
 
-    assert first == second
-    assert len(first) == 16
+    assert first == second == _HELLO_WORLD_FILES_HASH
+
+
+def test_hash_stream_contents_matches_files() -> None:
+    streams = [io.BytesIO(b"hello\n"), io.BytesIO(b"world\n")]
+
+    assert hash_stream_contents(streams) == _HELLO_WORLD_FILES_HASH
+
+
+def test_hash_file_contents_mmap_matches_buffered_reads(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    files = [tmp_path / "a.jsonl", tmp_path / "b.jsonl", tmp_path / "empty.jsonl"]
+    files[0].write_bytes(b"hello\n" * 1000)
+    files[1].write_bytes(b"world\n")
+    files[2].write_bytes(b"")
+    buffered = hash_file_contents(files + [tmp_path / "missing.jsonl"])
+
+    # Map every non-empty file instead of reading it through a buffer.
+    monkeypatch.setattr("curate_ns_pond.storage._MMAP_THRESHOLD", 1)
+
+    assert hash_file_contents(files) == buffered
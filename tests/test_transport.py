@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from curate_ns_pond.services import (
+    EntrezSummaryClient,
+    PMCIdConverter,
+    SemanticScholarClient,
+    transport,
+)
+from curate_ns_pond.services.transport import build_client
+
+
+def test_clients_share_pool_that_survives_close(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    class _Pool(httpx.BaseTransport):
+        def handle_request(self, request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            return httpx.Response(200, json={"ok": True})
+
+        def close(self) -> None:  # pragma: no cover - must not be reached
+            raise AssertionError("shared pool closed by a client")
+
+    monkeypatch.setattr(transport, "_POOL", _Pool())
+
+    first = build_client(timeout=5.0)
+    second = build_client(timeout=5.0, headers={"x-api-key": "secret"})
+    first.get("https://example.org/a")
+    first.close()
+
+    assert second.get("https://example.org/b").json() == {"ok": True}
+    assert calls == ["https://example.org/a", "https://example.org/b"]
+    second.close()
+
+
+def test_http_cache_serves_repeats(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    pytest.importorskip("hishel")
+    calls: list[tuple[str, bytes]] = []
+
+    class _Pool(httpx.BaseTransport):
+        def handle_request(self, request: httpx.Request) -> httpx.Response:
+            calls.append((request.url.path, request.read()))
+            status = 503 if request.url.path == "/busy" else 200
+            return httpx.Response(status, json={"call": len(calls)})
+
+    monkeypatch.setattr(transport, "_POOL", _Pool())
+    transport.enable_http_cache(tmp_path / "http_cache")
+    try:
+        with build_client(timeout=5.0) as client:
+            assert client.get("https://example.org/a").json() == {"call": 1}
+            assert client.get("https://example.org/a").json() == {"call": 1}
+            client.post("https://example.org/batch", json={"ids": ["1"]})
+            client.post("https://example.org/batch", json={"ids": ["1"]})
+            client.post("https://example.org/batch", json={"ids": ["2"]})
+            client.get("https://example.org/busy")
+            client.get("https://example.org/busy")
+    finally:
+        transport.disable_http_cache()
+
+    assert [path for path, _ in calls] == ["/a", "/batch", "/batch", "/busy", "/busy"]
+    assert (tmp_path / "http_cache" / "responses.db").exists()
+
+
+def test_service_clients_build_http_client_on_first_use() -> None:
+    for service in (EntrezSummaryClient(), PMCIdConverter(), SemanticScholarClient()):
+        assert service._client is None
+        service.close()  # nothing to release yet
+
+        client = service.client
+        assert service.client is client
+        service.close()
+        assert client.is_closed